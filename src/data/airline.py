@@ -1,6 +1,10 @@
 """
 Python file containing the Airline class and all the related methods.
 """
+import sys  # Imported to intern the record type string.
+
+# Interned so that record type comparisons can succeed on identity alone.
+_AIRLINE_TYPE = sys.intern("airline")
 
 
 class Airline:
@@ -18,10 +22,21 @@ class Airline:
     - all relevant setters;
     - __str__: defining how an airline instance should appear when printed;
     - to_dict: transforming an airline instance into a dictionary;
-    - from_dict: creating an airline instance from an appropriate dictionary.
+    - as_row_tuple: transforming an airline instance into a table row;
+    - from_dict: creating an airline instance from an appropriate dictionary;
+    - from_trusted_dict: creating an airline instance from an already validated dictionary.
     """
 
-    def __init__(self, id_number=None, record_type="airline", company_name=""):
+    # Attributes are stored in fixed slots rather than a per-instance
+    # __dict__, reducing the memory footprint of each airline.
+    __slots__ = ('id', 'record_type', 'company_name')
+
+    # Range covered by the 12-digit IDs generated by the record manager,
+    # all of which start with a 9.
+    _ID_MIN = 9 * 10 ** 11
+    _ID_MAX = 10 ** 12
+
+    def __init__(self, id_number=None, record_type=_AIRLINE_TYPE, company_name=""):
         """
         Instantiating an airline with the specified attributes.
 
@@ -29,17 +44,11 @@ class Airline:
         placeholder value of 0 is used to identify the instance.
         """
         self.record_type = record_type
-        # Validate company name
-        if company_name is not None:
-            self.set_company_name(company_name)
-        else:
-            self.set_company_name("")
-
+        # Validate company name. A missing name (None) is rejected by
+        # the setter's emptiness check, just like an empty string.
+        self.set_company_name(company_name)
         # Validate ID if provided
-        if id_number is not None:
-            self.set_id(id_number)
-        else:
-            self.set_id(0)
+        self.set_id(id_number if id_number is not None else 0)
 
     # Defining all the getter methods for the Airline class.
     def get_id(self):
@@ -69,12 +78,14 @@ class Airline:
             raise TypeError("ID must be an integer")
 
         # Only validate the ID format if it's not the placeholder value
-        if newid != 0:
+        # Generated IDs are matched with an integer range check, other
+        # lengths fall back to inspecting the leading digit.
+        if newid != 0 and not self._ID_MIN <= newid < self._ID_MAX:
             if str(newid)[0] != "9":  # Checks if newid starts with the proper type identifier
                 raise ValueError("Airline IDs must start with a 9")
         self.id = newid
 
-    def set_record_type(self, newtype="airline"):
+    def set_record_type(self, newtype=_AIRLINE_TYPE):
         """
         Setter method changing an airline's record type.
 
@@ -84,9 +95,9 @@ class Airline:
         For example, national or international airlines.
         """
         # Validate that type is "airline" for now.
-        if newtype != "airline":
+        if newtype != _AIRLINE_TYPE:
             raise ValueError("Record type must be 'airline'")
-        self.record_type = newtype
+        self.record_type = _AIRLINE_TYPE
 
     def set_company_name(self, new_company_name=""):
         """
@@ -98,7 +109,7 @@ class Airline:
 
     # Defining the __str__ method for the Airline class with better formatting
     def __str__(self):
-        return f"Airline ID: {self.get_id()}\nCompany Name: {self.get_company_name()}"
+        return f"Airline ID: {self.id}\nCompany Name: {self.company_name}"
 
     def to_dict(self):
         """
@@ -107,11 +118,19 @@ class Airline:
         to the requirements.
         """
         return {
-            "ID": self.get_id(),
-            "Type": self.get_record_type(),
-            "Company Name": self.get_company_name()
+            "ID": self.id,
+            "Type": self.record_type,
+            "Company Name": self.company_name
         }
 
+    def as_row_tuple(self):
+        """
+        Convert Airline object to the tuple of values
+        shown in a row of the airline table, in column
+        order: ID and company name.
+        """
+        return (self.id, self.company_name)
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -124,6 +143,23 @@ class Airline:
         """
         return cls(
             id_number=data.get("ID"),
-            record_type=data.get("Type", "airline"),
+            record_type=data.get("Type", _AIRLINE_TYPE),
             company_name=data.get("Company Name", "")
         )
+
+    @classmethod
+    def from_trusted_dict(cls, data):
+        """
+        Creates an Airline object from a dictionary that
+        is known to be valid, skipping the setters.
+
+        The method is used for records held by the record
+        manager, which were validated when they were written
+        or loaded, and hold every field, so re-running the
+        setter checks is redundant.
+        """
+        airline = cls.__new__(cls)
+        airline.id = data["ID"]
+        airline.record_type = _AIRLINE_TYPE
+        airline.company_name = data["Company Name"]
+        return airline
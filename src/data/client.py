@@ -1,6 +1,10 @@
 """
 Python file containing the Client class and all the related methods.
 """
+import sys  # Imported to intern the record type and location strings.
+
+# Interned so that record type comparisons can succeed on identity alone.
+_CLIENT_TYPE = sys.intern("client")
 
 
 class Client:
@@ -26,10 +30,24 @@ class Client:
     - all relevant setters;
     - __str__: defining how a client instance should appear when printed;
     - to_dict: transforming a client instance into a dictionary;
-    - from_dict: creating a client instance from an appropriate dictionary.
+    - as_row_tuple: transforming a client instance into a table row;
+    - from_dict: creating a client instance from an appropriate dictionary;
+    - from_trusted_dict: creating a client instance from an already validated dictionary;
+    - from_trusted_row: creating a client instance from an already validated table row.
     """
 
-    def __init__(self, id_number=None, record_type="client", name="", address_line_1="",
+    # Attributes are stored in fixed slots rather than a per-instance
+    # __dict__, reducing the memory footprint of each client.
+    __slots__ = ('id', 'record_type', 'name', 'address_line_1', 'address_line_2',
+                 'address_line_3', 'city', 'state', 'zip_code', 'country',
+                 'phone_number', '_full_address')
+
+    # Range covered by the 12-digit IDs generated by the record manager,
+    # all of which start with a 1.
+    _ID_MIN = 1 * 10 ** 11
+    _ID_MAX = 2 * 10 ** 11
+
+    def __init__(self, id_number=None, record_type=_CLIENT_TYPE, name="", address_line_1="",
                  address_line_2="", address_line_3="", city="", state="",
                  zip_code="", country="", phone_number=""):
         """
@@ -93,17 +111,23 @@ class Client:
     def get_full_address(self):
         """
         Getter method retrieving a client's full address.
+
+        The address is built on first access and cached until
+        one of the address lines is changed through its setter.
         """
-        # Only include non-empty address lines with proper formatting
-        address_parts = []
-        if self.address_line_1:
-            address_parts.append(self.address_line_1)
-        if self.address_line_2:
-            address_parts.append(self.address_line_2)
-        if self.address_line_3:
-            address_parts.append(self.address_line_3)
+        full_address = self._full_address
+        if full_address is None:
+            # Only include non-empty address lines with proper formatting
+            address_parts = []
+            if self.address_line_1:
+                address_parts.append(self.address_line_1)
+            if self.address_line_2:
+                address_parts.append(self.address_line_2)
+            if self.address_line_3:
+                address_parts.append(self.address_line_3)
 
-        return ", ".join(address_parts)
+            full_address = self._full_address = ", ".join(address_parts)
+        return full_address
 
     def get_city(self):
         """
@@ -144,12 +168,15 @@ class Client:
         if not isinstance(newid, int):  # Checks if newid is of the correct type
             raise TypeError("ID must be an integer")
 
-        # Checks if newid starts with the proper type identifier
-        if newid != 0 and str(newid)[0] != "1":
+        # Checks if newid starts with the proper type identifier. Generated
+        # IDs are matched with an integer range check, other lengths fall
+        # back to inspecting the leading digit.
+        if (newid != 0 and not self._ID_MIN <= newid < self._ID_MAX
+                and str(newid)[0] != "1"):
             raise ValueError("Client IDs must start with a 1")
         self.id = newid
 
-    def set_record_type(self, newtype="client"):
+    def set_record_type(self, newtype=_CLIENT_TYPE):
         """
         Setter method changing a client's record type.
 
@@ -159,9 +186,9 @@ class Client:
         For example, clients with special status for an airline.
         """
         # Validate that type is "client" for now.
-        if newtype != "client":
+        if newtype != _CLIENT_TYPE:
             raise ValueError("Record type must be 'client'")
-        self.record_type = newtype
+        self.record_type = _CLIENT_TYPE
 
     def set_name(self, newname=""):
         """
@@ -177,6 +204,7 @@ class Client:
         indication of the address.
         """
         self.address_line_1 = new_address_line_1
+        self._full_address = None  # Clears the cached full address.
 
     def set_address_line_2(self, new_address_line_2=""):
         """
@@ -184,6 +212,7 @@ class Client:
         indication of the address.
         """
         self.address_line_2 = new_address_line_2
+        self._full_address = None  # Clears the cached full address.
 
     def set_address_line_3(self, new_address_line_3=""):
         """
@@ -191,18 +220,21 @@ class Client:
         suite/unit indication of the address.
         """
         self.address_line_3 = new_address_line_3
+        self._full_address = None  # Clears the cached full address.
 
     def set_city(self, newcity=""):
         """
         Setter method changing a client's city.
         """
-        self.city = newcity
+        # Interned, as many clients share the same city.
+        self.city = sys.intern(newcity) if isinstance(newcity, str) else newcity
 
     def set_state(self, newstate=""):
         """
         Setter method changing a client's state/region.
         """
-        self.state = newstate
+        # Interned, as many clients share the same state.
+        self.state = sys.intern(newstate) if isinstance(newstate, str) else newstate
 
     def set_zip_code(self, newzip=""):
         """
@@ -214,7 +246,8 @@ class Client:
         """
         Setter method changing a client's country.
         """
-        self.country = newcountry
+        # Interned, as many clients share the same country.
+        self.country = sys.intern(newcountry) if isinstance(newcountry, str) else newcountry
 
     def set_phone_number(self, newphone=""):
         """
@@ -224,14 +257,14 @@ class Client:
 
     # Defining the __str__ method for the Client class with better formatting
     def __str__(self):
-        return (f"Client ID: {self.get_id()}\n"
-                f"Name: {self.get_name()}\n"
+        return (f"Client ID: {self.id}\n"
+                f"Name: {self.name}\n"
                 f"Address: {self.get_full_address()}\n"
-                f"City: {self.get_city()}\n"
-                f"State or Region: {self.get_state()}\n"
-                f"Postal or Zip: {self.get_zip_code()}\n"
-                f"Country: {self.get_country()}\n"
-                f"Phone number: {self.get_phone_number()}")
+                f"City: {self.city}\n"
+                f"State or Region: {self.state}\n"
+                f"Postal or Zip: {self.zip_code}\n"
+                f"Country: {self.country}\n"
+                f"Phone number: {self.phone_number}")
 
     def to_dict(self):
         """
@@ -240,19 +273,29 @@ class Client:
         to requirements.
         """
         return {
-            "ID": self.get_id(),
-            "Type": self.get_record_type(),
-            "Name": self.get_name(),
-            "Address Line 1": self.get_address_line_1(),
-            "Address Line 2": self.get_address_line_2(),
-            "Address Line 3": self.get_address_line_3(),
-            "City": self.get_city(),
-            "State": self.get_state(),
-            "Zip Code": self.get_zip_code(),
-            "Country": self.get_country(),
-            "Phone Number": self.get_phone_number()
+            "ID": self.id,
+            "Type": self.record_type,
+            "Name": self.name,
+            "Address Line 1": self.address_line_1,
+            "Address Line 2": self.address_line_2,
+            "Address Line 3": self.address_line_3,
+            "City": self.city,
+            "State": self.state,
+            "Zip Code": self.zip_code,
+            "Country": self.country,
+            "Phone Number": self.phone_number
         }
 
+    def as_row_tuple(self):
+        """
+        Convert Client object to the tuple of values
+        shown in a row of the client table, in column
+        order, from the ID to the phone number.
+        """
+        return (self.id, self.name, self.address_line_1, self.address_line_2,
+                self.address_line_3, self.city, self.state, self.zip_code,
+                self.country, self.phone_number)
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -265,7 +308,7 @@ class Client:
         """
         return cls(
             id_number=data.get("ID"),
-            record_type=data.get("Type", "client"),
+            record_type=data.get("Type", _CLIENT_TYPE),
             name=data.get("Name", ""),
             address_line_1=data.get("Address Line 1", ""),
             address_line_2=data.get("Address Line 2", ""),
@@ -276,3 +319,44 @@ class Client:
             country=data.get("Country", ""),
             phone_number=data.get("Phone Number", "")
         )
+
+    @classmethod
+    def from_trusted_dict(cls, data):
+        """
+        Creates a Client object from a dictionary that
+        is known to be valid, skipping the setters.
+
+        The method is used for records held by the record
+        manager, which were validated when they were written
+        or loaded, and hold every field, so re-running the
+        setter checks is redundant.
+        """
+        client = cls.__new__(cls)
+        client.id = data["ID"]
+        client.record_type = _CLIENT_TYPE
+        client.name = data["Name"]
+        client.address_line_1 = data["Address Line 1"]
+        client.address_line_2 = data["Address Line 2"]
+        client.address_line_3 = data["Address Line 3"]
+        client.city = data["City"]
+        client.state = data["State"]
+        client.zip_code = data["Zip Code"]
+        client.country = data["Country"]
+        client.phone_number = data["Phone Number"]
+        client._full_address = None  # pylint: disable=protected-access
+        return client
+
+    @classmethod
+    def from_trusted_row(cls, row):
+        """
+        Creates a Client object from a table row, as built by
+        as_row_tuple, whose values are known to be valid,
+        skipping the setters like from_trusted_dict.
+        """
+        client = cls.__new__(cls)
+        (client.id, client.name, client.address_line_1, client.address_line_2,
+         client.address_line_3, client.city, client.state, client.zip_code,
+         client.country, client.phone_number) = row
+        client.record_type = _CLIENT_TYPE
+        client._full_address = None  # pylint: disable=protected-access
+        return client
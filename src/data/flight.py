@@ -2,6 +2,65 @@
 Python file containing the Flight class and all the related methods.
 """
 from datetime import datetime  # Imported to properly format date elements in flight instances.
+from functools import lru_cache  # Imported to memoize the parsing of date strings.
+import sys  # Imported to intern the record type and city strings.
+
+# Interned so that record type comparisons can succeed on identity alone.
+_FLIGHT_TYPE = sys.intern("flight")
+
+
+@lru_cache(maxsize=10000)
+def _parse_date(date_string):
+    """
+    Convert a date string into a datetime object.
+
+    Results are memoized by input string: flights often share
+    the same dates, so each distinct string is only parsed once.
+    Since datetime objects are immutable, sharing them is safe.
+
+    fromisoformat accepts all three documented formats directly,
+    so the strptime fallbacks (and the exceptions leading to them)
+    are only reached for loosely formatted input, such as dates
+    without zero padding.
+    """
+    try:  # Tries to convert the date to a date format if the string compliant with ISO8601.
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        try:  # Tries to adjusts the date given as a string to an appropriate format.
+            return datetime.strptime(date_string, "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            try:  # Tries to adjusts the date given as a string to an appropriate format.
+                return datetime.strptime(date_string, "%Y-%m-%d")
+            except ValueError as ex:  # If no adjustments are possible, raises an error.
+                raise ValueError(
+                    "Invalid date format. Use YYYY-MM-DD HH:MM:SS, or YYYY-MM-DD.") from ex
+
+
+@lru_cache(maxsize=10000)
+def _format_date(date):
+    """
+    Convert a datetime object into its ISO 8601 string.
+
+    Results are memoized by naive datetime: parsed dates are shared
+    between flights, so each distinct date is only formatted once
+    when records are serialized.
+    """
+    return date.isoformat()
+
+
+@lru_cache(maxsize=10000)
+def _display_date(date):
+    """
+    Convert a naive datetime object into the string shown
+    when a flight is printed, memoized like _format_date.
+
+    isoformat produces the same text as strftime with the
+    '%Y-%m-%d %H:%M:%S' format for four-digit years, at about
+    a third of the cost.
+    """
+    if date.year >= 1000:
+        return date.isoformat(' ', 'seconds')
+    return date.strftime('%Y-%m-%d %H:%M:%S')
 
 
 class Flight:
@@ -22,11 +81,24 @@ class Flight:
     - all relevant setters;
     - __str__: defining how a flight instance should appear when printed;
     - to_dict: transforming a flight instance into a dictionary;
-    - from_dict: creating a flight instance from an appropriate dictionary.
+    - from_dict: creating a flight instance from an appropriate dictionary;
+    - from_trusted_dict: creating a flight instance from an already validated dictionary.
     """
 
+    # Attributes are stored in fixed slots rather than a per-instance
+    # __dict__, reducing the memory footprint of each flight.
+    __slots__ = ('record_type', 'client_id', 'airline_id', 'date',
+                 'start_city', 'end_city')
+
+    # Ranges covered by the 12-digit client and airline IDs
+    # generated by the record manager.
+    _CLIENT_ID_MIN = 1 * 10 ** 11
+    _CLIENT_ID_MAX = 2 * 10 ** 11
+    _AIRLINE_ID_MIN = 9 * 10 ** 11
+    _AIRLINE_ID_MAX = 10 ** 12
+
     def __init__(self, client_id, airline_id, date, start_city="", end_city="",
-                 record_type="flight"):
+                 record_type=_FLIGHT_TYPE):
         """
         Instantiating a flight with the specified attributes.
 
@@ -85,12 +157,15 @@ class Flight:
         if not isinstance(new_client_id, int):  # Checks if new_client_id is of the correct type.
             raise TypeError("Client ID must be an integer")
 
-        # Checks if newid starts with the proper type identifier
-        if str(new_client_id)[0] != "1":
+        # Checks if newid starts with the proper type identifier. Generated
+        # IDs are matched with an integer range check, other lengths fall
+        # back to inspecting the leading digit.
+        if (not self._CLIENT_ID_MIN <= new_client_id < self._CLIENT_ID_MAX
+                and str(new_client_id)[0] != "1"):
             raise ValueError("Clients' IDs must start with a 1")
         self.client_id = new_client_id
 
-    def set_record_type(self, newtype="flight"):
+    def set_record_type(self, newtype=_FLIGHT_TYPE):
         """
         Setter method changing a flight's record type.
 
@@ -100,9 +175,9 @@ class Flight:
         For example, special flights for an airline.
         """
         # Validate that type is "flight" for now.
-        if newtype != "flight":
+        if newtype != _FLIGHT_TYPE:
             raise ValueError("Record type must be 'flight'")
-        self.record_type = newtype
+        self.record_type = _FLIGHT_TYPE
 
     def set_airline_id(self, new_airline_id):
         """
@@ -112,7 +187,8 @@ class Flight:
             raise TypeError("Airline ID must be an integer")
 
         # Checks if new_airline_id is in proper format.
-        if str(new_airline_id)[0] != "9":
+        if (not self._AIRLINE_ID_MIN <= new_airline_id < self._AIRLINE_ID_MAX
+                and str(new_airline_id)[0] != "9"):
             raise ValueError("Airlines' IDs must start with a 9")
         self.airline_id = new_airline_id
 
@@ -124,18 +200,7 @@ class Flight:
         an appropriate date format.
         """
         if isinstance(new_date, str):  # Checks whether the date is a string.
-            try:  # Tries to convert the date to a date format if the string compliant with ISO8601.
-                self.date = datetime.fromisoformat(new_date)
-            except ValueError:
-                try:  # Tries to adjusts the date given as a string to an appropriate format.
-                    self.date = datetime.strptime(
-                        new_date, "%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    try:  # Tries to adjusts the date given as a string to an appropriate format.
-                        self.date = datetime.strptime(new_date, "%Y-%m-%d")
-                    except ValueError as ex:  # If no adjustments are possible, raises an error.
-                        raise ValueError(
-                            "Invalid date format. Use YYYY-MM-DD HH:MM:SS, or YYYY-MM-DD.") from ex
+            self.date = _parse_date(new_date)
         # If in the correct format, set date.
         elif isinstance(new_date, datetime):
             self.date = new_date
@@ -148,7 +213,9 @@ class Flight:
         """
         if not new_start_city:
             raise ValueError("Start city cannot be empty")
-        self.start_city = new_start_city
+        # Interned, as many flights share the same cities.
+        self.start_city = (sys.intern(new_start_city) if isinstance(new_start_city, str)
+                           else new_start_city)
 
     def set_end_city(self, new_end_city):
         """
@@ -156,13 +223,20 @@ class Flight:
         """
         if not new_end_city:
             raise ValueError("End city cannot be empty")
-        self.end_city = new_end_city
+        # Interned, as many flights share the same cities.
+        self.end_city = (sys.intern(new_end_city) if isinstance(new_end_city, str)
+                         else new_end_city)
 
     # Defining the __str__ method for the Flight class with better formatting
     def __str__(self):
-        return (f"Client ID: {self.get_client_id()}, Airline ID: {self.get_airline_id()}\n"
-                f"Date: {self.get_date().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                f"Route: {self.get_start_city()} to {self.get_end_city()}")
+        date = self.date
+        # strftime dominates the cost of printing a flight, so naive dates are
+        # formatted through a cache; aware dates are formatted every time.
+        date_str = (_display_date(date) if date.tzinfo is None
+                    else date.strftime('%Y-%m-%d %H:%M:%S'))
+        return (f"Client ID: {self.client_id}, Airline ID: {self.airline_id}\n"
+                f"Date: {date_str}\n"
+                f"Route: {self.start_city} to {self.end_city}")
 
     def to_dict(self):
         """
@@ -174,15 +248,20 @@ class Flight:
         for storage.
         """
         # Date conversion from date format to string format.
-        date_str = self.get_date().isoformat() if isinstance(
-            self.get_date(), datetime) else self.get_date()
+        date = self.date
+        if not isinstance(date, datetime):
+            date_str = date
+        elif date.tzinfo is None:
+            date_str = _format_date(date)
+        else:  # Aware dates in different zones can compare equal, so they are not cached.
+            date_str = date.isoformat()
         return {
-            "Type": self.get_record_type(),
-            "Client_ID": self.get_client_id(),
-            "Airline_ID": self.get_airline_id(),
+            "Type": self.record_type,
+            "Client_ID": self.client_id,
+            "Airline_ID": self.airline_id,
             "Date": date_str,
-            "Start City": self.get_start_city(),
-            "End City": self.get_end_city()
+            "Start City": self.start_city,
+            "End City": self.end_city
         }
 
     @classmethod
@@ -201,5 +280,25 @@ class Flight:
             date=data.get("Date"),
             start_city=data.get("Start City", ""),
             end_city=data.get("End City", ""),
-            record_type=data.get("Type", "flight")
+            record_type=data.get("Type", _FLIGHT_TYPE)
         )
+
+    @classmethod
+    def from_trusted_dict(cls, data):
+        """
+        Creates a Flight object from a dictionary that
+        is known to be valid, skipping the setters.
+
+        The method is used for records held by the record
+        manager, which were validated when they were written
+        or loaded, and hold every field. Stored dates are always in ISO format, as
+        produced by to_dict, so they are parsed directly.
+        """
+        flight = cls.__new__(cls)
+        flight.record_type = _FLIGHT_TYPE
+        flight.client_id = data["Client_ID"]
+        flight.airline_id = data["Airline_ID"]
+        flight.date = _parse_date(data["Date"])
+        flight.start_city = data["Start City"]
+        flight.end_city = data["End City"]
+        return flight
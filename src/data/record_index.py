@@ -0,0 +1,148 @@
+"""
+Python file containing the FlightIndex class and the search helpers
+used by the RecordManager class to look records up without scanning them.
+"""
+
+from datetime import datetime  # Imported to parse the dates of stored flights.
+from functools import lru_cache  # Imported to memoize the parsing of stored dates.
+from itertools import count  # Imported to number flights in the order they are stored.
+
+
+@lru_cache(maxsize=10000)
+def stored_day(date_string):
+    """
+    Convert the date stored in a flight record into a date object,
+    or None if it cannot be parsed. Memoized, since flights share dates
+    and the same records are searched repeatedly.
+    """
+    try:
+        return datetime.fromisoformat(date_string).date()
+    except (ValueError, TypeError):
+        return None
+
+
+def build_search_text(record):
+    """
+    Join the lowercased values of a record's fields, except its type,
+    into a single string that searches can test with one 'in' check.
+
+    The values are separated by a NUL character, which cannot be typed
+    into a search box, so a match never spans two fields.
+    """
+    return "\0".join(str(value).lower() for key, value in record.items()
+                      if key != "Type" and value is not None)
+
+
+class FlightIndex:
+    """
+    FlightIndex class holding the flight records of a record manager,
+    in the order they were stored, together with their indexes.
+
+    FlightIndex Class Attributes:
+    - records (dict): flight records, by a serial number giving their order.
+    - by_client (dict): index mapping each client's ID to its flight records.
+    - by_airline (dict): index mapping each airline's ID to its flight records.
+    - lowered_cities (dict): lowercased name of each city flown from or to, by name.
+    - _serials (dict): serial number of each stored flight record, by object id.
+    - _next_serial (count): source of the serial numbers.
+
+    FlightIndex Class Methods:
+    - add: stores a new flight record after all the others.
+    - replace: replaces a stored flight record, keeping its place.
+    - remove: removes a stored flight record.
+    """
+
+    def __init__(self):
+        # Flights have no unique key, so each one is given a serial number
+        # when stored. Updates and deletions find a flight's entry from
+        # its serial number instead of searching a list.
+        self.records = {}
+        self._serials = {}
+        self._next_serial = count()
+        # Indexes of the flight records by client and by airline. A client can
+        # book several flights, so each ID maps to a list of records kept in
+        # the order in which they were stored.
+        self.by_client = {}
+        self.by_airline = {}
+        # Lowercased name of every city stored in a flight. Flights share
+        # a small number of cities, so each name is lowercased only once.
+        self.lowered_cities = {}
+
+    def add(self, record):
+        """
+        Store a new flight record after all the others and index it.
+        """
+        serial = next(self._next_serial)
+        self.records[serial] = record
+        self._serials[id(record)] = serial
+        self._index(record)
+        self._add_lowered_cities(record)
+
+    def replace(self, record, new_record):
+        """
+        Replace a stored flight record with its updated version,
+        keeping its place among the flights.
+        """
+        serial = self._serials.pop(id(record))
+        self.records[serial] = new_record
+        self._serials[id(new_record)] = serial
+        self._reindex(record, new_record)
+        self._add_lowered_cities(new_record)
+
+    def remove(self, record):
+        """
+        Remove a stored flight record and its index entries.
+        """
+        del self.records[self._serials.pop(id(record))]
+        self._unindex(record)
+
+    def _add_lowered_cities(self, record):
+        """
+        Add the lowercased names of a flight record's cities, if missing.
+        Names are never removed, since other flights may still use them.
+        """
+        for city in (record.get("Start City"), record.get("End City")):
+            if isinstance(city, str) and city not in self.lowered_cities:
+                self.lowered_cities[city] = city.lower()
+
+    def _index(self, record):
+        """
+        Add a flight record to the flight indexes.
+        """
+        self.by_client.setdefault(record.get("Client_ID"), []).append(record)
+        self.by_airline.setdefault(record.get("Airline_ID"), []).append(record)
+
+    def _unindex(self, record):
+        """
+        Remove a flight record from the flight indexes.
+        Records are matched by identity, since two flights
+        can hold the same values.
+        """
+        for index, key in ((self.by_client, record.get("Client_ID")),
+                           (self.by_airline, record.get("Airline_ID"))):
+            flights = index[key]
+            for i, flight_record in enumerate(flights):
+                if flight_record is record:
+                    del flights[i]
+                    break
+            if not flights:  # Drops empty lists, so that lookups can rely on their absence.
+                del index[key]
+
+    def _reindex(self, record, new_record):
+        """
+        Replace a flight record with its updated version in the flight
+        indexes. When the client and airline are unchanged, the new
+        record takes the old one's place, preserving the flights' order.
+        """
+        if (record.get("Client_ID") != new_record.get("Client_ID") or
+                record.get("Airline_ID") != new_record.get("Airline_ID")):
+            self._unindex(record)
+            self._index(new_record)
+            return
+
+        for flights in (self.by_client[record.get("Client_ID")],
+                        self.by_airline[record.get("Airline_ID")]):
+            for i, flight_record in enumerate(flights):
+                if flight_record is record:
+                    flights[i] = new_record
+                    break
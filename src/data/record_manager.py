@@ -3,19 +3,57 @@ Principal python file containing the RecordManager class.
 This module defines the main functionalities of the Record Management System.
 """
 
+from contextlib import contextmanager  # Imported to group changes into a single save.
 from datetime import datetime  # Imported to properly format dates.
+from itertools import chain  # Imported to combine the records of every type.
+import json  # Imported to encode and decode records when orjson is not available.
 import os  # Imported to properly handly file paths.
 import random  # Imported to create random IDs for clients and airlines.
-# Imported to manage the input/output to the record storage files.
-import jsonlines
+import sys  # Imported to intern repeated strings of loaded records.
+try:
+    # Imported to encode and decode records several times faster than the json module.
+    import orjson
+except ImportError:  # orjson is optional, the json module is used without it.
+    orjson = None
 from .flight import Flight
 from .client import Client
 from .airline import Airline
+from .record_index import FlightIndex, build_search_text, stored_day
 # Get the project root directory to save the record.jsonl files
 # to the correct folder.
 project_root = os.path.dirname(os.path.dirname(
     os.path.dirname(os.path.abspath(__file__))))
 default_file_path = os.path.join(project_root, "src", "record", "record.jsonl")
+# Fields whose values repeat across many records. They are interned on load,
+# so identical values share one string object and compare by identity.
+_INTERNED_FIELDS = ("Type", "City", "State", "Country", "Start City", "End City")
+# Ranges of the 12-digit IDs generated for each record type. The first
+# digit of every ID in a range is the type identifier of its records.
+_ID_RANGES = {"client": (1 * 10 ** 11, 2 * 10 ** 11),
+              "airline": (9 * 10 ** 11, 10 ** 12)}
+# Fields that loaded records of each known type must hold to be read.
+_REQUIRED_FIELDS = {
+    "client": frozenset(("ID", "Name")),
+    "airline": frozenset(("ID", "Company Name")),
+    "flight": frozenset(("Client_ID", "Airline_ID", "Date", "Start City", "End City")),
+}
+# Optional client fields, set to an empty string when missing from a loaded client.
+_CLIENT_OPTIONAL_FIELDS = ("Address Line 1", "Address Line 2", "Address Line 3",
+                           "City", "State", "Zip Code", "Country", "Phone Number")
+# Buffer size used when reading the record storage file.
+_BUFFER_SIZE = 1 << 20
+# Amount of encoded records collected in memory before each write when saving.
+_WRITE_CHUNK_SIZE = 4 << 20
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(record):
+        """Encode a record as a UTF-8 JSON line, without the line break."""
+        return json.dumps(record, ensure_ascii=False).encode("utf-8")
 
 
 class RecordManager:
@@ -25,12 +63,36 @@ class RecordManager:
 
     RecordManager Class Attributes:
     - file_path (str): location of the data storage file.
-    - records (list): list containing dictionaries. Each dictionary is a record.
+    - records (tuple): read-only tuple containing dictionaries. Each dictionary is a record.
+    - _dirty (bool): whether records were updated or deleted since the last save.
+    - _batch_depth (int): number of open batch blocks.
+    - _pending_records (list): records created during a batch, not yet in the file.
+    - _clients_by_id (dict): client records, by ID.
+    - _airlines_by_id (dict): airline records, by ID.
+    - _flights (FlightIndex): flight records, in the order they were stored, and their indexes.
+    - _other_records (list): records of no known type, kept so that they are saved back.
+    - skipped_records (list): loaded records that are invalid or repeat an ID, not read.
+    - _client_search_text (dict): lowercased searchable text of each client, by ID.
+    - _airline_search_text (dict): lowercased searchable text of each airline, by ID.
+    - clients_version (int): number of changes made to the client records.
+    - airlines_version (int): number of changes made to the airline records.
+    - flights_version (int): number of changes made to the flight records.
+    - _next_ids (dict): next candidate ID for each record type.
 
     RecordManager Class Methods:
     - load_records: imports records from the data storage file into the records attribute.
     - save_records: saves records from the records attribute to the data storage file.
+    - flush: saves records to the data storage file only if there are unsaved changes.
+    - batch: context manager postponing all writes to the data storage file until its end.
     - get_next_id: creates a new id for either a client or an airline record.
+    - search_client_ids: finds the IDs of the clients matching a search key.
+    - create_flights: adds several flight records with a single write.
+    - get_all_airlines: retrieves every airline record.
+    - iter_airlines: iterates over every airline record.
+    - iter_clients: iterates over every client record.
+    - get_client_names: maps the ID of every client to its name.
+    - get_airline_names: maps the ID of every airline to its company name.
+    - iter_flights: iterates over every flight record.
     - CRUD methods for client records.
     - CRUD methods for airline records.
     - CRUD methods for flight records.
@@ -39,31 +101,235 @@ class RecordManager:
 
     def __init__(self, file_path=default_file_path):
         self.file_path = file_path
-        self.records = []  # Initiates an empty list of records.
-        # Uploads records from the file to the records list.
+        # Updates and deletions are kept in memory until the next flush.
+        self._dirty = False
+        # Inside a batch, new records are also kept in memory until its end.
+        self._batch_depth = 0
+        self._pending_records = []
+        # Records are stored separately for each type, so that operations on
+        # one type never visit the others. Clients and airlines are held by ID.
+        self._clients_by_id = {}
+        self._airlines_by_id = {}
+        # Flights are held with their indexes by client and by airline.
+        self._flights = FlightIndex()
+        self._other_records = []
+        self.skipped_records = []
+        # Searchable text of each client and airline, so that searches
+        # do not lowercase every field of every record again.
+        self._client_search_text = {}
+        self._airline_search_text = {}
+        # Counters increased by every change to the clients, airlines or
+        # flights, so that views derived from them can tell when they are stale.
+        self.clients_version = 0
+        self.airlines_version = 0
+        self.flights_version = 0
+        # Uploads records from the file.
         self.load_records()
+        # IDs are handed out in increasing order, starting after the highest
+        # generated ID already in use for each record type.
+        self._next_ids = {
+            "client": self._first_unused_id(self._clients_by_id, *_ID_RANGES["client"]),
+            "airline": self._first_unused_id(self._airlines_by_id, *_ID_RANGES["airline"]),
+        }
+
+    @property
+    def records(self):
+        """
+        Tuple of all records, each one a dictionary, grouped by type.
+
+        The tuple is built from the records of every type on each access.
+        It cannot be changed, so that adding or replacing records through
+        it fails instead of being silently lost. Records are changed
+        through the CRUD methods.
+        """
+        return tuple(self._iter_records())
+
+    def _iter_records(self):
+        """
+        Iterate over the records of every type, without copying them.
+        Records of unknown type come first, then the clients, the
+        airlines and the flights, each in the order they were stored.
+        """
+        return chain(self._other_records, self._clients_by_id.values(),
+                     self._airlines_by_id.values(), self._flights.records.values())
 
     def load_records(self):
         """Load records from JSONL file if it exists"""
-        if os.path.exists(self.file_path):
-            # Open the jsonl file in read mode.
-            with jsonlines.open(self.file_path, 'r') as file:
-                for line in file:
-                    # Cycles through all records and uploads them to the records list.
-                    self.records.append(line)
-            # Closes the jsonl file once all records have been uploaded locally.
-            file.close()
-        else:
+        # Opening the file directly, rather than checking first that it
+        # exists, needs a single system call when it does.
+        try:
+            # Open the jsonl file in buffered binary read mode.
+            file = open(self.file_path, 'rb', buffering=_BUFFER_SIZE)
+        except FileNotFoundError:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            return
+        with file:
+            for raw_line in file:
+                if not raw_line.strip():  # Skips blank lines.
+                    continue
+                line = _loads(raw_line)
+                # Interns the repeated fields, so that the type checks made
+                # when scanning the records compare by identity.
+                for key in _INTERNED_FIELDS:
+                    value = line.get(key)
+                    if isinstance(value, str):
+                        line[key] = sys.intern(value)
+                # Cycles through all records and stores them by type.
+                self._add_record(line)
+
+    def _add_record(self, record):
+        """
+        Store a loaded record with the records of its type.
+
+        Invalid records, and records repeating a client or airline ID
+        already used, are kept unchanged with the records of unknown
+        type, so that they are saved back but never read. They are
+        also listed in skipped_records, so that they can be reported.
+        """
+        record_type = record.get("Type")
+        if record_type not in _REQUIRED_FIELDS:
+            self._other_records.append(record)
+            return
+        if not self._is_valid_record(record_type, record):
+            self._skip_record(record)
+        elif record_type == "flight":
+            self._flights.add(record)
+        elif record_type == "client":
+            client_id = record["ID"]
+            if client_id in self._clients_by_id:
+                self._skip_record(record)
+                return
+            for key in _CLIENT_OPTIONAL_FIELDS:
+                record.setdefault(key, "")
+            self._clients_by_id[client_id] = record
+            self._client_search_text[client_id] = build_search_text(record)
+        else:
+            airline_id = record["ID"]
+            if airline_id in self._airlines_by_id:
+                self._skip_record(record)
+                return
+            self._airlines_by_id[airline_id] = record
+            self._airline_search_text[airline_id] = build_search_text(record)
+
+    def _skip_record(self, record):
+        """
+        Keep a loaded record that cannot be read, so that it is saved back.
+        """
+        self._other_records.append(record)
+        self.skipped_records.append(record)
+
+    @staticmethod
+    def _is_valid_record(record_type, record):
+        """
+        Check that a loaded record holds the fields required for its type,
+        with values of the types the records are read with.
+
+        Only the keys and value types are checked, rather than running the
+        setters of the record's class, since loaded records are read
+        through from_trusted_dict.
+        """
+        if not _REQUIRED_FIELDS[record_type] <= record.keys():
+            return False
+        if record_type == "flight":
+            date = record["Date"]
+            start_city = record["Start City"]
+            end_city = record["End City"]
+            return (isinstance(record["Client_ID"], int)
+                    and isinstance(record["Airline_ID"], int)
+                    and isinstance(date, str) and stored_day(date) is not None
+                    and isinstance(start_city, str) and start_city != ""
+                    and isinstance(end_city, str) and end_city != "")
+        name = record["Name"] if record_type == "client" else record["Company Name"]
+        return isinstance(record["ID"], int) and isinstance(name, str) and name != ""
 
     def save_records(self):
         """Save records to JSONL file"""
-        with jsonlines.open(self.file_path, 'w') as file:  # Open the jsonl file in write mode.
-            for record in self.records:  # Copies all records back into the jsonl file.
-                file.write(record)
-            # Closes the jsonl file once all records have been copied.
-            file.close()
+        # Records are encoded into a single buffer, which is written out
+        # whenever it reaches the chunk size, bounding the memory used.
+        buffer = bytearray()
+        extend = buffer.extend
+        dumps = _dumps
+        with open(self.file_path, 'wb') as file:  # Open the jsonl file in binary write mode.
+            for record in self._iter_records():  # Copies all records back into the jsonl file.
+                extend(dumps(record))
+                extend(b"\n")
+                if len(buffer) >= _WRITE_CHUNK_SIZE:
+                    file.write(buffer)
+                    buffer.clear()
+            file.write(buffer)
+        self._dirty = False  # The file now matches the records list.
+        self._pending_records.clear()
+
+    def flush(self):
+        """
+        Save records to JSONL file if there are unsaved changes.
+
+        Updates and deletions only mark the records as changed,
+        so that a series of them rewrites the file once. Records
+        created during a batch are appended together, unless the
+        file has to be rewritten anyway.
+        """
+        if self._dirty:
+            self.save_records()
+        elif self._pending_records:
+            self._write_appended(self._pending_records)
+            self._pending_records.clear()
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager grouping a series of changes into a single save.
+
+        Within the block, created records are not written to the file
+        one by one. When the outermost block ends, all the changes are
+        saved at once through flush.
+
+        Usage:
+        - with record_manager.batch():
+              record_manager.create_client(client)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def _append_record(self, record):
+        """
+        Append a single new record to the JSONL file.
+
+        New records go at the end of the records list, so the
+        file is extended by one line instead of being rewritten.
+        During a batch, the record is only queued.
+        """
+        if self._batch_depth:
+            self._pending_records.append(record)
+        else:
+            self._write_appended((record,))
+
+    def _write_appended(self, records):
+        """
+        Append the given records to the JSONL file, one per line.
+        """
+        with open(self.file_path, 'ab') as file:  # Open the jsonl file in append mode.
+            file.write(b"".join(_dumps(record) + b"\n" for record in records))
+
+    @staticmethod
+    def _first_unused_id(used_ids, id_min, id_max):
+        """
+        Find the ID following the highest used ID in the range
+        [id_min, id_max), or the first ID of the range if none is used.
+        IDs outside the range, such as short manually chosen ones, are
+        ignored.
+        """
+        highest = id_min
+        for used_id in used_ids:
+            if isinstance(used_id, int) and id_min <= used_id < id_max and used_id > highest:
+                highest = used_id
+        return highest + 1
 
     def get_next_id(self, record_type):
         """
@@ -71,8 +337,7 @@ class RecordManager:
         It is assumed that a maximum of 100 billion IDs are allowed
         for each record type.
 
-        The function extracts all the IDs currently employed by the
-        management system. It then sets a type identifier:
+        The function uses a type identifier:
 
         - integer 1 for clients' records;
         - integer 9 for airlines' records;
@@ -80,9 +345,11 @@ class RecordManager:
         The type identifier will prefix the IDs to allow a quick
         appropriateness check of the ID.
 
-        A random integer ID is then generated and the type identifier
-        is prefixed. If the ID create already exists, another random
-        ID is generated.
+        IDs are handed out in increasing order from a counter kept for
+        each record type, skipping any ID that is already in use. Only
+        once the highest ID of the type has been reached is a random ID
+        generated, with the type identifier prefixed. If the ID created
+        already exists, another random ID is generated.
 
         Args:
         - record_type (str) :   the type of the record for which the
@@ -92,10 +359,19 @@ class RecordManager:
         - random_id (int)   :   an integer ID whose prefix indicates
                                 the type of record the ID identifies.
         """
-        # Extracts all used IDs
-        used_ids = []
-        for record in self.records:
-            used_ids.append(record.get("ID"))
+        # All used IDs are the keys of the client and airline indexes.
+        used_clients = self._clients_by_id
+        used_airlines = self._airlines_by_id
+
+        # Hands out the next ID of the counter when the range is not exhausted.
+        if record_type in self._next_ids:
+            used_ids = used_clients if record_type == "client" else used_airlines
+            next_id = self._next_ids[record_type]
+            while next_id in used_ids:  # Skips IDs of records created with explicit IDs.
+                next_id += 1
+            if next_id < _ID_RANGES[record_type][1]:
+                self._next_ids[record_type] = next_id + 1
+                return next_id
 
         # Set type identifier for record type
         type_identifier = 0
@@ -112,7 +388,7 @@ class RecordManager:
         # If the id is already used for another record, a new random id is created.
         # Even at 99% capacity (when 99 billion id have already been used), on average
         # the while loop will repeat for 64 times.
-        while random_id in used_ids:
+        while random_id in used_clients or random_id in used_airlines:
             random_id = int(str(type_identifier) +
                             str(random.randint(1, 99999999999)).rjust(11, "0"))
 
@@ -138,15 +414,18 @@ class RecordManager:
         # Check if client with same ID already exists.
         # Alhtough not strictly needed, this ensures that if the get_new_id method is changed,
         # the data storage file will not contain repeated entries.
-        for record in self.records:
-            if record.get("Type") == "client" and record.get("ID") == client.get_id():
-                raise ValueError(
-                    f"Client with ID {client.get_id()} already exists")
+        client_id = client.get_id()
+        if client_id in self._clients_by_id:
+            raise ValueError(
+                f"Client with ID {client_id} already exists")
 
         # Add the client record
-        self.records.append(client.to_dict())
-        self.save_records()
-        return client.get_id()
+        record = client.to_dict()
+        self._clients_by_id[client_id] = record
+        self._client_search_text[client_id] = build_search_text(record)
+        self.clients_version += 1
+        self._append_record(record)
+        return client_id
 
     def get_client(self, client_id):
         """
@@ -159,11 +438,33 @@ class RecordManager:
         - The client record (Client) corresponding to the ID if it exists.
         - None (None) if there are no clients with the provided ID.
         """
-        for record in self.records:  # Cycles through all records to find correspondence.
-            if record.get("Type") == "client" and record.get("ID") == client_id:
-                return Client.from_dict(record)
+        record = self._clients_by_id.get(client_id)  # Looks the ID up in the index.
+        if record is not None:
+            return Client.from_trusted_dict(record)
         return None
 
+    def iter_clients(self):
+        """
+        Iterate over all client records, building each Client
+        object only when it is reached.
+
+        Output:
+        - An iterator of the clients (Client), in the order they were stored.
+        """
+        # All clients are held in the index, so no other records are visited.
+        return map(Client.from_trusted_dict, self._clients_by_id.values())
+
+    def get_client_names(self):
+        """
+        Retrieve the name of every client, read directly from
+        the records, without building Client objects.
+
+        Output:
+        - names (dict): the name (str) of each client, by ID (int).
+        """
+        return {client_id: record["Name"]
+                for client_id, record in self._clients_by_id.items()}
+
     def update_client(self, client):
         """
         Update an existing client record.
@@ -181,14 +482,19 @@ class RecordManager:
         if not hasattr(client, 'to_dict'):  # Input validation.
             raise TypeError("The input must be a Client object")
 
-        # Identifies the position of the record to update.
-        for i, record in enumerate(self.records):
-            if record.get("Type") == "client" and record.get("ID") == client.get_id():
-                # Updates the record with the new data.
-                self.records[i] = client.to_dict()
-                self.save_records()  # Saves the record.
-                return True
-        return False
+        # Looks up the record to update in the index.
+        client_id = client.get_id()
+        record = self._clients_by_id.get(client_id)
+        if record is None:
+            return False
+
+        # Updates the record with the new data.
+        new_record = client.to_dict()
+        self._clients_by_id[client_id] = new_record
+        self._client_search_text[client_id] = build_search_text(new_record)
+        self.clients_version += 1
+        self._dirty = True  # Marks the change for the next flush.
+        return True
 
     def delete_client(self, client_id):
         """
@@ -205,19 +511,22 @@ class RecordManager:
         Side effect:
         - The record is, possibly, deleted.
         """
-        for i, record in enumerate(self.records):
-            if record.get("Type") == "client" and record.get("ID") == client_id:
-                # Check if there are any flights associated with this client
-                for flight_record in self.records:
-                    if "Client_ID" in flight_record and flight_record.get("Client_ID") == client_id:
-                        raise ValueError(
-                            f"Cannot delete client with ID {client_id} "
-                            f"as it has associated flights")
-
-                del self.records[i]
-                self.save_records()
-                return True
-        return False
+        record = self._clients_by_id.get(client_id)
+        if record is None:
+            return False
+
+        # Check if there are any flights associated with this client,
+        # with a single lookup in the flight index.
+        if self._flights.by_client.get(client_id):
+            raise ValueError(
+                f"Cannot delete client with ID {client_id} "
+                f"as it has associated flights")
+
+        del self._clients_by_id[client_id]
+        del self._client_search_text[client_id]
+        self.clients_version += 1
+        self._dirty = True  # Marks the change for the next flush.
+        return True
 
     def search_clients(self, search_term):
         """
@@ -229,22 +538,30 @@ class RecordManager:
         Output:
         - results (list): a list of records corresponding with the search key.
         """
-        results = []  # Initialize empty list of results
+        clients_by_id = self._clients_by_id
+        return [Client.from_trusted_dict(clients_by_id[client_id])
+                for client_id in self.search_client_ids(search_term)]
+
+    def search_client_ids(self, search_term):
+        """
+        Search for clients by any field using partial matching,
+        returning only their IDs.
+
+        No Client objects are built, so callers needing a few
+        of the matches can fetch them later through get_client.
+
+        Arg:
+        - search_term (str): search key.
 
+        Output:
+        - results (list): a list of the IDs of the matching clients.
+        """
         # Format the search term to lowercase for case-insensitive matching
         search_term_lower = search_term.lower()
 
-        for record in self.records:
-            if record.get("Type") == "client":
-                # Try to match the search term against any field
-                if any(
-                    search_term_lower in str(value).lower()
-                    for key, value in record.items()
-                    if key != "Type" and value is not None
-                ):
-                    results.append(Client.from_dict(record))
-
-        return results
+        # Try to match the search term against the joined fields of each client
+        return [client_id for client_id, search_text in self._client_search_text.items()
+                if search_term_lower in search_text]
 
     # Airline CRUD operations
     def create_airline(self, airline):
@@ -266,15 +583,18 @@ class RecordManager:
         # Check if airline with same ID already exists
         # Alhtough not strictly needed, this ensures that if the get_new_id method is changed,
         # the data storage file will not contain repeated entries.
-        for record in self.records:
-            if record.get("Type") == "airline" and record.get("ID") == airline.get_id():
-                raise ValueError(
-                    f"Airline with ID {airline.get_id()} already exists")
+        airline_id = airline.get_id()
+        if airline_id in self._airlines_by_id:
+            raise ValueError(
+                f"Airline with ID {airline_id} already exists")
 
         # Add the airline record
-        self.records.append(airline.to_dict())
-        self.save_records()
-        return airline.get_id()
+        record = airline.to_dict()
+        self._airlines_by_id[airline_id] = record
+        self._airline_search_text[airline_id] = build_search_text(record)
+        self.airlines_version += 1
+        self._append_record(record)
+        return airline_id
 
     def get_airline(self, airline_id):
         """
@@ -287,11 +607,42 @@ class RecordManager:
         - The airline record (Airline) corresponding to the ID if it exists.
         - None (None) if there are no airlines with the provided ID.
         """
-        for record in self.records:  # Cycles through all records to check correspondence.
-            if record.get("Type") == "airline" and record.get("ID") == airline_id:
-                return Airline.from_dict(record)
+        record = self._airlines_by_id.get(airline_id)  # Looks the ID up in the index.
+        if record is not None:
+            return Airline.from_trusted_dict(record)
         return None
 
+    def get_all_airlines(self):
+        """
+        Retrieve all airline records.
+
+        Output:
+        - results (list): a list of all the airlines (Airline), in the order they were stored.
+        """
+        return list(self.iter_airlines())
+
+    def iter_airlines(self):
+        """
+        Iterate over all airline records, building each Airline
+        object only when it is reached.
+
+        Output:
+        - An iterator of the airlines (Airline), in the order they were stored.
+        """
+        # All airlines are held in the index, so no other records are visited.
+        return map(Airline.from_trusted_dict, self._airlines_by_id.values())
+
+    def get_airline_names(self):
+        """
+        Retrieve the company name of every airline, read directly
+        from the records, without building Airline objects.
+
+        Output:
+        - names (dict): the company name (str) of each airline, by ID (int).
+        """
+        return {airline_id: record["Company Name"]
+                for airline_id, record in self._airlines_by_id.items()}
+
     def update_airline(self, airline):
         """
         Update an existing airline record.
@@ -309,13 +660,18 @@ class RecordManager:
         if not hasattr(airline, 'to_dict'):  # Input validation
             raise TypeError("The input must be an Airline object")
 
-        # Identifies the position of the record to update.
-        for i, record in enumerate(self.records):
-            if record.get("Type") == "airline" and record.get("ID") == airline.get_id():
-                self.records[i] = airline.to_dict()  # Updates the record.
-                self.save_records()  # Saves the record.
-                return True
-        return False
+        # Looks up the record to update in the index.
+        airline_id = airline.get_id()
+        record = self._airlines_by_id.get(airline_id)
+        if record is None:
+            return False
+
+        new_record = airline.to_dict()
+        self._airlines_by_id[airline_id] = new_record  # Updates the record.
+        self._airline_search_text[airline_id] = build_search_text(new_record)
+        self.airlines_version += 1
+        self._dirty = True  # Marks the change for the next flush.
+        return True
 
     def delete_airline(self, airline_id):
         """
@@ -332,20 +688,22 @@ class RecordManager:
         Side effect:
         - The record is, possibly, deleted.
         """
-        for i, record in enumerate(self.records):
-            if record.get("Type") == "airline" and record.get("ID") == airline_id:
-                # Check if there are any flights associated with this airline
-                for flight_record in self.records:
-                    if "Airline_ID" in flight_record and \
-                            flight_record.get("Airline_ID") == airline_id:
-                        raise ValueError(
-                            f"Cannot delete airline with ID {airline_id} "
-                            f"as it has associated flights")
-
-                del self.records[i]
-                self.save_records()
-                return True
-        return False
+        record = self._airlines_by_id.get(airline_id)
+        if record is None:
+            return False
+
+        # Check if there are any flights associated with this airline,
+        # with a single lookup in the flight index.
+        if self._flights.by_airline.get(airline_id):
+            raise ValueError(
+                f"Cannot delete airline with ID {airline_id} "
+                f"as it has associated flights")
+
+        del self._airlines_by_id[airline_id]
+        del self._airline_search_text[airline_id]
+        self.airlines_version += 1
+        self._dirty = True  # Marks the change for the next flush.
+        return True
 
     def search_airlines(self, search_term):
         """
@@ -357,21 +715,16 @@ class RecordManager:
         Output:
         - results (list): a list of records corresponding with the search key.
         """
-        results = []  # Initialised empty list of results.
-
         # Format the search term to lowercase for case-insensitive matching
         search_term_lower = search_term.lower()
 
-        for record in self.records:
-            if record.get("Type") == "airline":
-                # Search by company name (case-insensitive)
-                if search_term_lower in record.get("Company Name", "").lower():
-                    results.append(Airline.from_dict(record))
-                # Search by ID (including partial matches)
-                elif search_term in str(record.get("ID", "")):
-                    results.append(Airline.from_dict(record))
-
-        return results
+        # Try to match the search term against the joined ID and company
+        # name of each airline. IDs only hold digits, so matching them
+        # with the lowercased search term finds the same airlines.
+        airlines_by_id = self._airlines_by_id
+        return [Airline.from_trusted_dict(airlines_by_id[airline_id])
+                for airline_id, search_text in self._airline_search_text.items()
+                if search_term_lower in search_text]
 
     # Flight CRUD operations
     def create_flight(self, flight):
@@ -387,28 +740,62 @@ class RecordManager:
             raise TypeError("The input must be a Flight object")
 
         # Verify that the client and airline exist
-        client_exists = False  # Client check flag.
-        airline_exists = False  # Airline check flag.
+        client_id = flight.get_client_id()
+        airline_id = flight.get_airline_id()
 
-        for record in self.records:
-            if record.get("Type") == "client" and record.get("ID") == flight.get_client_id():
-                client_exists = True  # If client exists, updates flag to True.
-            if record.get("Type") == "airline" and record.get("ID") == flight.get_airline_id():
-                # If airline exists, updates flag to True.
-                airline_exists = True
-
-        if not client_exists:  # Validation over clients.
+        if client_id not in self._clients_by_id:  # Validation over clients.
             raise ValueError(
-                f"Client with ID {flight.get_client_id()} does not exist")
-        if not airline_exists:  # Validation over airlines.
+                f"Client with ID {client_id} does not exist")
+        if airline_id not in self._airlines_by_id:  # Validation over airlines.
             raise ValueError(
-                f"Airline with ID {flight.get_airline_id()} does not exist")
+                f"Airline with ID {airline_id} does not exist")
 
         # Add the flight record
-        self.records.append(flight.to_dict())
-        self.save_records()
+        record = flight.to_dict()
+        self._flights.add(record)
+        self._append_record(record)
+        self.flights_version += 1
         # Return a tuple of the composite key instead of an ID
-        return (flight.get_client_id(), flight.get_airline_id(), flight.get_date())
+        return (client_id, airline_id, flight.get_date())
+
+    def create_flights(self, flights):
+        """
+        Add several new flight records at once.
+
+        All the flights are validated before any of them is added, so
+        either all of them are created or none is. The new records are
+        appended to the jsonl file with a single write.
+
+        Arg:
+        - flights (iterable): flight objects.
+
+        Output:
+        - keys (list): for each flight, a tuple containing the client_id (int),
+          the airline_id (int) and the date, as returned by create_flight.
+        """
+        flights = list(flights)
+        for flight in flights:
+            if not hasattr(flight, 'to_dict'):  # Input validation.
+                raise TypeError("The input must be a Flight object")
+            # Verify that the client and airline exist
+            if flight.get_client_id() not in self._clients_by_id:
+                raise ValueError(
+                    f"Client with ID {flight.get_client_id()} does not exist")
+            if flight.get_airline_id() not in self._airlines_by_id:
+                raise ValueError(
+                    f"Airline with ID {flight.get_airline_id()} does not exist")
+
+        keys = []
+        with self.batch():  # Queues the new records, writing them once at the end.
+            for flight in flights:
+                record = flight.to_dict()
+                self._flights.add(record)
+                self._append_record(record)
+                keys.append((flight.get_client_id(), flight.get_airline_id(),
+                             flight.get_date()))
+        if keys:
+            self.flights_version += 1
+        return keys
 
     def get_flight(self, client_id, airline_id, date=None):
         """Retrieve a flight record by client_id and airline_id.
@@ -422,13 +809,12 @@ class RecordManager:
         - The flight (Flight) corresponding to the input data, if it exists.
         - None (None) if no flight exists with the given data.
         """
-        for record in self.records:
-            if (record.get("Type") == "flight" and
-                record.get("Client_ID") == client_id and
-                    record.get("Airline_ID") == airline_id):
+        # Only the flights of the given client are checked.
+        for record in self._flights.by_client.get(client_id, ()):
+            if record["Airline_ID"] == airline_id:
                 # If date is provided, check it too
-                if date is None or record.get("Date") == date:
-                    return Flight.from_dict(record)
+                if date is None or record["Date"] == date:
+                    return Flight.from_trusted_dict(record)
         return None
 
     def get_flights_by_client(self, client_id):
@@ -441,12 +827,9 @@ class RecordManager:
         Output:
         - results (list): a list of the flights for that specific client.
         """
-        results = []  # Initiates empty list of results.
-        for record in self.records:
-            if record.get("Type") == "flight" and record.get("Client_ID") == client_id:
-                # Appends all flights for the given client.
-                results.append(Flight.from_dict(record))
-        return results
+        # All flights for the given client are held in the index.
+        return [Flight.from_trusted_dict(record)
+                for record in self._flights.by_client.get(client_id, ())]
 
     def get_flights_by_airline(self, airline_id):
         """
@@ -458,12 +841,20 @@ class RecordManager:
         Output:
         - results (list): a list of the flights for that specific airline.
         """
-        results = []  # Initiates empty list of results.
-        for record in self.records:
-            if record.get("Type") == "flight" and record.get("Airline_ID") == airline_id:
-                # Appends all flights for the given airline.
-                results.append(Flight.from_dict(record))
-        return results
+        # All flights for the given airline are held in the index.
+        return [Flight.from_trusted_dict(record)
+                for record in self._flights.by_airline.get(airline_id, ())]
+
+    def iter_flights(self):
+        """
+        Iterate over all flight records, building each Flight
+        object only when it is reached.
+
+        Output:
+        - An iterator of the flights (Flight), in the order they were stored.
+        """
+        # All flights are held together, so no other records are visited.
+        return map(Flight.from_trusted_dict, self._flights.records.values())
 
     def update_flight(self, flight, client_id, airline_id, date):
         """
@@ -482,17 +873,17 @@ class RecordManager:
         if not hasattr(flight, 'to_dict'):  # Input validation.
             raise TypeError("The input must be a Flight object")
 
-        # Convert date to string format if it's a datetime object
+        # Convert date to string format if it's a datetime object. Stored
+        # dates are always ISO strings, so they are compared directly.
         date_str = date.isoformat() if isinstance(date, datetime) else date
 
-        # Identifies the position of the flight record.
-        for i, record in enumerate(self.records):
-            if (record.get("Type") == "flight" and
-                record.get("Client_ID") == client_id and
-                record.get("Airline_ID") == airline_id and
-                    str(record.get("Date")) == str(date_str)):
-                self.records[i] = flight.to_dict()  # Updates the record.
-                self.save_records()  # Saves the record.
+        # Identifies the flight record among the flights of the client.
+        for record in self._flights.by_client.get(client_id, ()):
+            if record["Airline_ID"] == airline_id and record["Date"] == date_str:
+                new_record = flight.to_dict()
+                self._flights.replace(record, new_record)  # Updates the record.
+                self.flights_version += 1
+                self._dirty = True  # Marks the change for the next flush.
                 return True
         return False
 
@@ -503,7 +894,7 @@ class RecordManager:
         Args:
         - client_id (int): the client's identifier.
         - airline_id (int): the airline's identifier.
-        - [date] (str): the date of the flight.
+        - [date] (str or datetime): the date of the flight.
 
         Output:
         - True (bool) if the update was successful.
@@ -512,14 +903,19 @@ class RecordManager:
         Side effect:
         - The record is, possibly, updated with the new values.
         """
-        for i, record in enumerate(self.records):  # Identifies the position of the record.
-            if (record.get("Type") == "flight" and
-                record.get("Client_ID") == client_id and
-                    record.get("Airline_ID") == airline_id):
+        # Convert date to string format if it's a datetime object. Stored
+        # dates are always ISO strings, so they are compared directly.
+        if isinstance(date, datetime):
+            date = date.isoformat()
+
+        # Identifies the flight record among the flights of the client.
+        for record in self._flights.by_client.get(client_id, ()):
+            if record["Airline_ID"] == airline_id:
                 # If date is provided, check it too
-                if date is None or record.get("Date") == date:
-                    del self.records[i]  # Deletes the record.
-                    self.save_records()  # Updates the data storage file.
+                if date is None or record["Date"] == date:
+                    self._flights.remove(record)  # Deletes the record.
+                    self.flights_version += 1
+                    self._dirty = True  # Marks the change for the next flush.
                     return True
         return False
 
@@ -540,32 +936,41 @@ class RecordManager:
         """
         results = []
 
-        for record in self.records:
-            if record.get("Type") == "flight":
-                match = True  # Flag checking for input validation.
-
-                if start_city and start_city.lower() not in record.get("Start City", "").lower():
-                    match = False
-                if end_city and end_city.lower() not in record.get("End City", "").lower():
-                    match = False
-                if date:
-                    record_date = record.get("Date")
-                    if isinstance(date, str) and record_date != date:
-                        match = False
-                    elif isinstance(date, datetime):
-                        try:
-                            record_datetime = datetime.fromisoformat(
-                                record_date)
-                            if record_datetime.date() != date.date():
-                                match = False
-                        except (ValueError, TypeError):
-                            match = False
-                if client_id and record.get("Client_ID") != client_id:
-                    match = False
-                if airline_id and record.get("Airline_ID") != airline_id:
-                    match = False
-
-                if match:
-                    results.append(Flight.from_dict(record))
+        # Starts from the flights of the given client or airline when possible,
+        # instead of checking every record. Flights taken from an index all
+        # match its ID, so that ID is not checked again for each of them.
+        if client_id:
+            candidates = self._flights.by_client.get(client_id, ())
+            client_id = None
+        elif airline_id:
+            candidates = self._flights.by_airline.get(airline_id, ())
+            airline_id = None
+        else:
+            candidates = self._flights.records.values()
+
+        # Search keys are prepared once rather than for every record.
+        start_city_lower = start_city.lower() if start_city else None
+        end_city_lower = end_city.lower() if end_city else None
+        search_day = date.date() if date and isinstance(date, datetime) else None
+        search_date_str = date if date and isinstance(date, str) else None
+
+        # Stored flights always hold every field, so they are read by subscription.
+        # City names are matched against their lowercased form, kept when stored.
+        lowered_cities = self._flights.lowered_cities
+        for record in candidates:
+            if start_city_lower and start_city_lower not in lowered_cities[record["Start City"]]:
+                continue
+            if end_city_lower and end_city_lower not in lowered_cities[record["End City"]]:
+                continue
+            if search_date_str is not None and record["Date"] != search_date_str:
+                continue
+            if search_day is not None and stored_day(record["Date"]) != search_day:
+                continue
+            if client_id and record["Client_ID"] != client_id:
+                continue
+            if airline_id and record["Airline_ID"] != airline_id:
+                continue
+
+            results.append(Flight.from_trusted_dict(record))
 
         return results
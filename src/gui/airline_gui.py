@@ -17,6 +17,9 @@ class AirlineGUI:
     airline records through a user-friendly interface with tables and forms.
     """
 
+    # Columns of the airline treeview: heading, width and whether it stretches.
+    TREE_COLUMNS = (("ID", 150, False), ("Company Name", 400, True))
+
     def __init__(self, master, record_manager):
         self.master = master
         self.record_manager = record_manager
@@ -28,6 +31,8 @@ class AirlineGUI:
         # Initialize variables
         self.tree = None
         self.search_var = tk.StringVar()
+        # Rows currently in the treeview, by item ID (the airline's ID).
+        self._shown_rows = {}
 
         # Initialize update variables
         self.update_id_var = None
@@ -39,6 +44,24 @@ class AirlineGUI:
         # Initialize selected_airline
         self.selected_airline = None
 
+        # Pending callback clearing the status line, if any
+        self._status_clear_id = None
+
+        # Entry widgets currently showing their placeholder text
+        self._placeholder_entries = set()
+
+        # Modal windows, built on first use and then reused
+        self._new_record_modal = None
+        self._update_record_modal = None
+        self._update_airline = None
+
+        # Rows found by previous searches, by lowercased search term.
+        # Cleared whenever an airline is created, updated or deleted.
+        self._search_cache = {}
+        # Lowercased search term whose results are shown, or None
+        # when all the airlines are shown.
+        self._shown_search = None
+
         # Create UI elements
         self.create_airline_records_frame()
 
@@ -61,18 +84,6 @@ class AirlineGUI:
         """Change the background colour of the label when it is clicked."""
         event.widget.config(bg='#A3A3A3')
 
-    def button_on_enter(self, event):
-        """Change the background colour of the button when the mouse enters."""
-        event.widget.config(bg='#BFBFBF')
-
-    def button_on_leave(self, event):
-        """Reset the background colour of the button when the mouse leaves."""
-        event.widget.config(bg='#F0F0F0')
-
-    def button_on_click(self, event):
-        """Change the background colour of the button when it is clicked."""
-        event.widget.config(bg='#BFBFBF')
-
     def create_airline_records_frame(self):
         """
         Create the main frame for displaying airline records.
@@ -96,26 +107,20 @@ class AirlineGUI:
         button_frame = tk.Frame(button_search_frame, bg='#CCCCCC')
         button_frame.pack(side='left', padx=5)
 
-        create_button = tk.Button(
-            button_frame, text="Create", command=self.open_new_record_modal)
+        create_button = ttk.Button(
+            button_frame, text="Create", command=self.open_new_record_modal,
+            style="Hover.TButton")
         create_button.pack(side='left', padx=20, pady=10)
-        create_button.bind("<Enter>", self.button_on_enter)
-        create_button.bind("<Leave>", self.button_on_leave)
-        create_button.bind("<Button-1>", self.button_on_click)
 
-        update_button = tk.Button(
-            button_frame, text="Update", command=self.open_update_record_modal)
+        update_button = ttk.Button(
+            button_frame, text="Update", command=self.open_update_record_modal,
+            style="Hover.TButton")
         update_button.pack(side='left', padx=10, pady=10)
-        update_button.bind("<Enter>", self.button_on_enter)
-        update_button.bind("<Leave>", self.button_on_leave)
-        update_button.bind("<Button-1>", self.button_on_click)
 
-        delete_button = tk.Button(
-            button_frame, text="Delete", command=self.delete_airline)
+        delete_button = ttk.Button(
+            button_frame, text="Delete", command=self.delete_airline,
+            style="Hover.TButton")
         delete_button.pack(side='left', padx=20, pady=10)
-        delete_button.bind("<Enter>", self.button_on_enter)
-        delete_button.bind("<Leave>", self.button_on_leave)
-        delete_button.bind("<Button-1>", self.button_on_click)
 
         # Create a frame for search field and button
         search_frame = tk.Frame(button_search_frame, bg='#CCCCCC')
@@ -127,22 +132,25 @@ class AirlineGUI:
         search_field.pack(side='left', padx=5)
 
         # Allows search using enter key
-        search_field.bind("<Return>", lambda event: self.search_airlines())
+        search_field.bind("<Return>", self.on_search_return)
 
         # Add Clear Search button
-        clear_button = tk.Button(
-            search_frame, text="Clear Search", command=self.clear_search)
+        clear_button = ttk.Button(
+            search_frame, text="Clear Search", command=self.clear_search,
+            style="Hover.TButton")
         clear_button.pack(side='right', padx=5, pady=5)
-        clear_button.bind("<Enter>", self.button_on_enter)
-        clear_button.bind("<Leave>", self.button_on_leave)
-        clear_button.bind("<Button-1>", self.button_on_click)
 
-        search_button = tk.Button(
-            search_frame, text="Search", command=self.search_airlines)
+        search_button = ttk.Button(
+            search_frame, text="Search", command=self.search_airlines,
+            style="Hover.TButton")
         search_button.pack(side='right', padx=30, pady=5)
-        search_button.bind("<Enter>", self.button_on_enter)
-        search_button.bind("<Leave>", self.button_on_leave)
-        search_button.bind("<Button-1>", self.button_on_click)
+
+        # Add a status line below the treeview, reporting successful changes
+        # without a message box that blocks the window until dismissed.
+        # It is packed first, so that the expanding treeview leaves room for it.
+        self.status_label = tk.Label(
+            self.airline_records_frame, text="", fg='green', bg='#CCCCCC')
+        self.status_label.pack(side='bottom', fill='x')
 
         # Create a Treeview widget with the specified columns
         self.create_airline_treeview()
@@ -153,14 +161,15 @@ class AirlineGUI:
         Sets up the treeview with appropriate columns, scrollbars, and event bindings
         for user interaction such as selection, double-click, and keyboard shortcuts.
         """
-        columns = ("ID", "Company Name")
+        columns = tuple(col for col, _, _ in self.TREE_COLUMNS)
         self.tree = ttk.Treeview(
             self.airline_records_frame, columns=columns, show='headings')
 
-        # Define the column headings
-        for col in columns:
+        # Define the column headings. Only the company name column stretches,
+        # so resizing the window does not recompute the width of every column.
+        for col, width, stretch in self.TREE_COLUMNS:
             self.tree.heading(col, text=col)
-            self.tree.column(col, width=100, stretch=True)
+            self.tree.column(col, width=width, minwidth=100, stretch=stretch, anchor='w')
 
         # Add vertical and horizontal scrollbars to the Treeview
         scrollbar_y = ttk.Scrollbar(
@@ -173,27 +182,45 @@ class AirlineGUI:
 
         self.tree.pack(side='top', fill='both', expand=True, padx=10, pady=10)
 
-        # Set the background colour of the Treeview
-        style = ttk.Style()
-        style.configure("Treeview", background="#D9D9D9",
-                        fieldbackground="#D9D9D9")
-
         # Bind select event
         self.tree.bind("<<TreeviewSelect>>", self.on_airline_select)
 
         # Add double click to update record
-        self.tree.bind(
-            "<Double-1>", lambda event: self.open_update_record_modal())
+        self.tree.bind("<Double-1>", self.on_tree_update)
 
         # Bind Backspace key to delete selected record
-        self.tree.bind("<BackSpace>", lambda event: self.delete_airline())
+        self.tree.bind("<BackSpace>", self.on_tree_delete)
 
         # Bind Enter key to open update modal for selected record
-        self.tree.bind(
-            "<Return>", lambda event: self.open_update_record_modal())
+        self.tree.bind("<Return>", self.on_tree_update)
+
+    def on_tree_update(self, event):  # pylint: disable=W0613
+        """Open the update modal for the selected record (Enter or double click)."""
+        self.open_update_record_modal()
+        return "break"  # The event is fully handled, skipping the default bindings.
+
+    def on_tree_delete(self, event):  # pylint: disable=W0613
+        """Delete the selected record (Backspace)."""
+        self.delete_airline()
+        return "break"
+
+    def on_search_return(self, event):  # pylint: disable=W0613
+        """Search for airlines when Enter is pressed in the search field."""
+        self.search_airlines()
+        return "break"
 
     def open_new_record_modal(self):
         """Open a modal window to create a new airline record."""
+        # The modal is built on first use, then hidden and shown again
+        if self._new_record_modal is None:
+            self._new_record_modal = self.build_new_record_modal()
+
+        # Clear the entry of the previous record
+        self.new_company_name_var.set("")
+        self.show_modal(self._new_record_modal)
+
+    def build_new_record_modal(self):
+        """Build the modal window used to create new airline records."""
         # Create a new Toplevel window (modal)
         new_record_modal = tk.Toplevel(self.main_frame)
         new_record_modal.title("New Airline Record")
@@ -226,24 +253,20 @@ class AirlineGUI:
         button_frame.pack(pady=10)
 
         # Add Create and Cancel buttons
-        create_button = tk.Button(button_frame, text="Create",
-                                  command=lambda: self.create_airline_from_modal(new_record_modal))
+        create_button = ttk.Button(button_frame, text="Create", style="Hover.TButton",
+                                   command=lambda: self.create_airline_from_modal(new_record_modal))
         create_button.pack(side='left', padx=5)
-        create_button.bind("<Enter>", self.button_on_enter)
-        create_button.bind("<Leave>", self.button_on_leave)
-        create_button.bind("<Button-1>", self.button_on_click)
 
-        cancel_button = tk.Button(
-            button_frame, text="Cancel", command=new_record_modal.destroy)
+        cancel_button = ttk.Button(
+            button_frame, text="Cancel", command=lambda: self.hide_modal(new_record_modal),
+            style="Hover.TButton")
         cancel_button.pack(side='left', padx=5)
-        cancel_button.bind("<Enter>", self.button_on_enter)
-        cancel_button.bind("<Leave>", self.button_on_leave)
-        cancel_button.bind("<Button-1>", self.button_on_click)
 
-        # Make the modal window modal (block interaction with the main window)
+        # Closing the window hides it too, so that it can be shown again
+        new_record_modal.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_modal(new_record_modal))
         new_record_modal.transient(self.main_frame)
-        new_record_modal.grab_set()
-        self.main_frame.wait_window(new_record_modal)
+        return new_record_modal
 
     def open_update_record_modal(self):
         """Open a modal window to update an existing airline record."""
@@ -255,82 +278,102 @@ class AirlineGUI:
             return
 
         # Get the selected airline
+        # Rows are identified by their airline's ID, so it is read without
+        # fetching the row's values from Tk.
         selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
 
         try:
-            airline = self.record_manager.get_airline(int(values[0]))
+            airline = self.record_manager.get_airline(int(selected_item))
             if not airline:
                 messagebox.showwarning("Warning", "Selected airline not found")
                 return
 
-            # Create a new Toplevel window (modal)
-            update_record_modal = tk.Toplevel(self.main_frame)
-            update_record_modal.title("Update Record")
-            self.center_window(update_record_modal, 700, 200)
-
-            # Add a label to the modal
-            label = tk.Label(update_record_modal,
-                             text="Update Record", font=('Arial', 14))
-            label.pack(pady=10)
-
-            # Create a frame for the input fields
-            input_frame = tk.Frame(update_record_modal)
-            input_frame.pack(pady=10, padx=10, fill='both', expand=True)
-
-            # Create entry variables and set values
-            self.update_id_var = tk.StringVar(value=airline.get_id())
-            self.update_company_name_var = tk.StringVar(
-                value=airline.get_company_name())
-
-            # Add input fields to the frame
-            # ID field
-            label = tk.Label(input_frame, text="ID:")
-            label.grid(row=0, column=0, sticky='e', pady=5, padx=5)
-            id_entry = tk.Entry(input_frame, width=30,
-                                textvariable=self.update_id_var)
-            id_entry.config(state='readonly')
-            id_entry.grid(row=0, column=1, pady=5, padx=5, sticky='ew')
-
-            # Company Name field
-            label = tk.Label(input_frame, text="Company Name:")
-            label.grid(row=1, column=0, sticky='e', pady=5, padx=5)
-            name_entry = tk.Entry(input_frame, width=30,
-                                  textvariable=self.update_company_name_var)
-            name_entry.grid(row=1, column=1, pady=5, padx=5, sticky='ew')
-
-            # Make the input fields responsive
-            input_frame.grid_columnconfigure(1, weight=1)
-
-            # Create a frame for the buttons
-            button_frame = tk.Frame(update_record_modal)
-            button_frame.pack(pady=10)
-
-            # Add Update and Cancel buttons
-            update_button = tk.Button(button_frame, text="Update",
-                                      command=lambda: self.update_airline_from_modal(
-                                          airline, update_record_modal))
-            update_button.pack(side='left', padx=5)
-            update_button.bind("<Enter>", self.button_on_enter)
-            update_button.bind("<Leave>", self.button_on_leave)
-            update_button.bind("<Button-1>", self.button_on_click)
-
-            cancel_button = tk.Button(
-                button_frame, text="Cancel", command=update_record_modal.destroy)
-            cancel_button.pack(side='left', padx=5)
-            cancel_button.bind("<Enter>", self.button_on_enter)
-            cancel_button.bind("<Leave>", self.button_on_leave)
-            cancel_button.bind("<Button-1>", self.button_on_click)
-
-            # Make the modal window modal (block interaction with the main window)
-            update_record_modal.transient(self.main_frame)
-            update_record_modal.grab_set()
-            self.main_frame.wait_window(update_record_modal)
+            # The modal is built on first use, then hidden and shown again
+            if self._update_record_modal is None:
+                self._update_record_modal = self.build_update_record_modal()
+
+            # Fill the entries with the selected airline's values
+            self._update_airline = airline
+            self.update_id_var.set(airline.get_id())
+            self.update_company_name_var.set(airline.get_company_name())
+            self.show_modal(self._update_record_modal)
 
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror(
                 "Error", f"Failed to open update modal: {str(e)}")
 
+    def build_update_record_modal(self):
+        """Build the modal window used to update airline records."""
+        # Create a new Toplevel window (modal)
+        update_record_modal = tk.Toplevel(self.main_frame)
+        update_record_modal.title("Update Record")
+        self.center_window(update_record_modal, 700, 200)
+
+        # Add a label to the modal
+        label = tk.Label(update_record_modal,
+                         text="Update Record", font=('Arial', 14))
+        label.pack(pady=10)
+
+        # Create a frame for the input fields
+        input_frame = tk.Frame(update_record_modal)
+        input_frame.pack(pady=10, padx=10, fill='both', expand=True)
+
+        # Create entry variables, filled each time the modal is opened
+        self.update_id_var = tk.StringVar()
+        self.update_company_name_var = tk.StringVar()
+
+        # Add input fields to the frame
+        # ID field
+        label = tk.Label(input_frame, text="ID:")
+        label.grid(row=0, column=0, sticky='e', pady=5, padx=5)
+        id_entry = tk.Entry(input_frame, width=30,
+                            textvariable=self.update_id_var)
+        id_entry.config(state='readonly')
+        id_entry.grid(row=0, column=1, pady=5, padx=5, sticky='ew')
+
+        # Company Name field
+        label = tk.Label(input_frame, text="Company Name:")
+        label.grid(row=1, column=0, sticky='e', pady=5, padx=5)
+        name_entry = tk.Entry(input_frame, width=30,
+                              textvariable=self.update_company_name_var)
+        name_entry.grid(row=1, column=1, pady=5, padx=5, sticky='ew')
+
+        # Make the input fields responsive
+        input_frame.grid_columnconfigure(1, weight=1)
+
+        # Create a frame for the buttons
+        button_frame = tk.Frame(update_record_modal)
+        button_frame.pack(pady=10)
+
+        # Add Update and Cancel buttons. The airline being updated
+        # is the one stored when the modal was last opened.
+        update_button = ttk.Button(button_frame, text="Update", style="Hover.TButton",
+                                   command=lambda: self.update_airline_from_modal(
+                                       self._update_airline, update_record_modal))
+        update_button.pack(side='left', padx=5)
+
+        cancel_button = ttk.Button(
+            button_frame, text="Cancel", command=lambda: self.hide_modal(update_record_modal),
+            style="Hover.TButton")
+        cancel_button.pack(side='left', padx=5)
+
+        # Closing the window hides it too, so that it can be shown again
+        update_record_modal.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_modal(update_record_modal))
+        update_record_modal.transient(self.main_frame)
+        return update_record_modal
+
+    def show_modal(self, modal):
+        """Show a modal window, blocking interaction with the main window."""
+        modal.deiconify()
+        modal.lift()
+        modal.grab_set()
+
+    def hide_modal(self, modal):
+        """Hide a modal window, keeping it to be shown again."""
+        modal.grab_release()
+        modal.withdraw()
+
     def create_airline_from_modal(self, modal):
         """Create a new airline record from the modal form."""
         try:
@@ -350,15 +393,15 @@ class AirlineGUI:
 
             # Add airline to record manager
             self.record_manager.create_airline(airline)
+            self._search_cache.clear()
 
-            # Refresh airline list
-            self.load_airlines()
+            # Add the new airline's row to the airline list
+            self.show_airline_row(airline)
 
             # Close the modal
-            modal.destroy()
+            self.hide_modal(modal)
 
-            messagebox.showinfo(
-                "Success", f"Airline {airline.get_company_name()} created successfully!")
+            self.show_status(f"Airline {airline.get_company_name()} created successfully!")
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror(
                 "Error", f"Failed to create airline: {str(e)}")
@@ -378,15 +421,15 @@ class AirlineGUI:
 
             # Update airline in record manager
             self.record_manager.update_airline(airline)
+            self._search_cache.clear()
 
-            # Refresh airline list
-            self.load_airlines()
+            # Refresh the airline's row in the airline list
+            self.show_airline_row(airline)
 
             # Close the modal
-            modal.destroy()
+            self.hide_modal(modal)
 
-            messagebox.showinfo(
-                "Success", f"Airline {airline.get_company_name()} updated successfully!")
+            self.show_status(f"Airline {airline.get_company_name()} updated successfully!")
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror(
                 "Error", f"Failed to update airline: {str(e)}")
@@ -402,10 +445,9 @@ class AirlineGUI:
 
         # Get the selected airline
         selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
 
         try:
-            airline_id = int(values[0])
+            airline_id = int(selected_item)  # The row's item ID is the airline's ID.
             airline = self.record_manager.get_airline(airline_id)
 
             if airline:
@@ -417,12 +459,12 @@ class AirlineGUI:
                 if confirm:
                     # Delete airline from record manager
                     self.record_manager.delete_airline(airline_id)
+                    self._search_cache.clear()
 
-                    # Refresh airline list
-                    self.load_airlines()
+                    # Remove the airline's row from the airline list
+                    self.remove_airline_row(airline_id)
 
-                    messagebox.showinfo(
-                        "Success", "Airline deleted successfully!")
+                    self.show_status("Airline deleted successfully!")
         except ValueError as e:
             if "associated flights" in str(e):
                 messagebox.showwarning(
@@ -448,19 +490,18 @@ class AirlineGUI:
             return
 
         try:
-            # Search airlines by company name
-            airlines = self.record_manager.search_airlines(search_term)
-
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Add search results to treeview
-            for airline in airlines:
-                self.tree.insert("", "end", values=(
-                    airline.get_id(),
-                    airline.get_company_name()
-                ))
+            # Search airlines by company name. Searches are case-insensitive,
+            # so the rows found are reused for any repeat of the same term.
+            cache_key = search_term.lower()
+            rows = self._search_cache.get(cache_key)
+            if rows is None:
+                airlines = self.record_manager.search_airlines(search_term)
+                rows = self._search_cache[cache_key] = [
+                    airline.as_row_tuple() for airline in airlines]
+
+            # Replace the rows of the treeview with the search results
+            self.fill_tree(rows)
+            self._shown_search = cache_key
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror("Error", f"Search failed: {str(e)}")
 
@@ -470,24 +511,98 @@ class AirlineGUI:
         if self.tree is None:
             return
 
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Get all airlines from record manager
-        airlines = []
-        for record in self.record_manager.records:
-            if record.get("Type") == "airline":
-                airline = self.record_manager.get_airline(record.get("ID"))
-                if airline:
-                    airlines.append(airline)
-
-        # Add airlines to treeview
-        for airline in airlines:
-            self.tree.insert("", "end", values=(
-                airline.get_id(),
-                airline.get_company_name()
-            ))
+        # Get all airlines from record manager, without an intermediate list
+        airlines = self.record_manager.iter_airlines()
+
+        # Replace the rows of the treeview with all the airlines
+        self.fill_tree([airline.as_row_tuple() for airline in airlines])
+        self._shown_search = None
+
+    def fill_tree(self, rows):
+        """
+        Make the treeview show the given rows, in order.
+
+        Each row is identified by its airline ID, which is used as
+        the treeview item ID. Only the differences with the rows
+        already shown are applied: rows no longer present are deleted
+        with a single call, new rows are inserted and changed rows are
+        updated in place, while unchanged rows are left untouched.
+        If the order of the remaining rows differs, they are all
+        inserted again.
+        """
+        tree = self.tree
+        shown_rows = self._shown_rows
+        new_rows = {str(row[0]): row for row in rows}
+
+        # Delete the rows that are no longer present
+        removed = [iid for iid in shown_rows if iid not in new_rows]
+        if removed:
+            tree.delete(*removed)
+            for iid in removed:
+                del shown_rows[iid]
+
+        # Clear the treeview if the remaining rows are not in the new order
+        kept = tuple(iid for iid in new_rows if iid in shown_rows)
+        if tree.get_children() != kept:
+            if kept:
+                tree.delete(*kept)
+            shown_rows.clear()
+
+        # Insert the new rows and update the changed ones
+        insert = tree.insert
+        for index, (iid, row) in enumerate(new_rows.items()):
+            shown_row = shown_rows.get(iid)
+            if shown_row is None:
+                insert("", index, iid=iid, values=row)
+            elif shown_row != row:
+                tree.item(iid, values=row)
+            shown_rows[iid] = row
+
+    def show_status(self, message):
+        """Show a message in the status line, clearing it after a few seconds."""
+        self.status_label.config(text=message)
+        if self._status_clear_id is not None:  # Keeps the new message for its full time.
+            self.master.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.master.after(2500, self.clear_status)
+
+    def clear_status(self):
+        """Clear the message in the status line."""
+        self._status_clear_id = None
+        self.status_label.config(text="")
+
+    def show_airline_row(self, airline):
+        """
+        Show an airline's current values in the treeview, updating
+        its row if present, or adding it at the end otherwise.
+        While search results are shown, an airline no longer matching
+        the search has its row removed instead.
+        """
+        iid = str(airline.get_id())
+        if not self.matches_shown_search(airline):
+            self.remove_airline_row(iid)
+            return
+        row = airline.as_row_tuple()
+        if iid in self._shown_rows:
+            self.tree.item(iid, values=row)
+        else:
+            self.tree.insert("", "end", iid=iid, values=row)
+        self._shown_rows[iid] = row
+
+    def matches_shown_search(self, airline):
+        """
+        Check whether an airline belongs in the treeview: always when all
+        the airlines are shown, otherwise when it matches the search shown,
+        by ID or company name like RecordManager.search_airlines.
+        """
+        search = self._shown_search
+        return (search is None or search in str(airline.get_id())
+                or search in airline.get_company_name().lower())
+
+    def remove_airline_row(self, airline_id):
+        """Remove an airline's row from the treeview, if present."""
+        iid = str(airline_id)
+        if self._shown_rows.pop(iid, None) is not None:
+            self.tree.delete(iid)
 
     def on_airline_select(self, event):  # pylint: disable=W0613
         """Handle airline selection in the treeview."""
@@ -500,11 +615,10 @@ class AirlineGUI:
 
         # Get the first selected item
         selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
 
         try:
-            # Get airline from record manager
-            airline = self.record_manager.get_airline(int(values[0]))
+            # Get airline from record manager. The row's item ID is the airline's ID.
+            airline = self.record_manager.get_airline(int(selected_item))
 
             # Store the selected airline for later use
             self.selected_airline = airline
@@ -516,14 +630,20 @@ class AirlineGUI:
         """Add a placeholder to the given entry widget."""
         entry.insert(0, placeholder)
         entry.config(fg='grey')
-        entry.bind("<FocusIn>", lambda event: self.clear_placeholder(
-            event, placeholder))
+        self._placeholder_entries.add(entry)
+        entry.bind("<FocusIn>", self.clear_placeholder)
         entry.bind("<FocusOut>", lambda event: self.set_placeholder(
             event, placeholder))
 
-    def clear_placeholder(self, event, placeholder):
-        """Clear the placeholder from the given entry widget."""
-        if event.widget.get() == placeholder:
+    def clear_placeholder(self, event):
+        """
+        Clear the placeholder from the given entry widget.
+
+        Entries showing their placeholder are tracked in a set, so that
+        text typed by the user is never mistaken for the placeholder.
+        """
+        if event.widget in self._placeholder_entries:
+            self._placeholder_entries.discard(event.widget)
             event.widget.delete(0, tk.END)
             event.widget.config(fg='black')
 
@@ -532,6 +652,7 @@ class AirlineGUI:
         if not event.widget.get():
             event.widget.insert(0, placeholder)
             event.widget.config(fg='grey')
+            self._placeholder_entries.add(event.widget)
 
     def center_window(self, window, width, height):
         """Center the given window on the screen."""
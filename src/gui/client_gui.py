@@ -8,6 +8,28 @@ including creating, reading, updating, and deleting client information.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from data.client import Client
+from .treeview_rows import append_rows
+
+# Fields of the new and update record modals, with the placeholders shown in
+# the new record modal's entries, and the grid row and label column of each
+# field, laid out two fields per line.
+_NEW_FIELDS = ("Given Name(s)", "Family Name", "Address Line 1", "Address Line 2",
+               "Address Line 3", "City", "State", "Zip Code", "Country", "Phone Number")
+_NEW_PLACEHOLDERS = {
+    "Given Name(s)": "First and middle name",
+    "Address Line 1": "Street name",
+    "Address Line 2": "Street or civic number",
+    "Address Line 3": "Apartment, suite, unit number, PO Box",
+    "Phone Number": "Include country code"
+}
+_UPDATE_FIELDS = ("ID", "Name", "Address Line 1", "Address Line 2",
+                  "Address Line 3", "City", "State", "Zip Code", "Country", "Phone Number")
+_FIELD_POSITIONS = tuple((i // 2, (i % 2) * 2) for i in range(len(_NEW_FIELDS)))
+# Keys released in the search field that leave its text unchanged
+_NON_EDITING_KEYS = frozenset((
+    "Return", "KP_Enter", "Tab", "ISO_Left_Tab", "Escape", "Left", "Right", "Up", "Down",
+    "Home", "End", "Prior", "Next", "Shift_L", "Shift_R", "Control_L", "Control_R",
+    "Alt_L", "Alt_R", "Caps_Lock"))
 
 
 class ClientGUI:
@@ -18,6 +40,12 @@ class ClientGUI:
     It handles all client-related operations including validation and error handling.
     """
 
+    # Columns of the client treeview: heading, width and whether it stretches.
+    TREE_COLUMNS = (("ID", 110, False), ("Name", 150, True), ("Address Line 1", 150, True),
+                    ("Address Line 2", 100, False), ("Address Line 3", 120, False),
+                    ("City", 100, False), ("State", 90, False), ("Zip Code", 80, False),
+                    ("Country", 100, False), ("Phone Number", 130, False))
+
     def __init__(self, master, record_manager):
         self.master = master
         self.record_manager = record_manager
@@ -25,30 +53,35 @@ class ClientGUI:
         # Initialize selected_client
         self.selected_client = None
 
-        # Initialize StringVar attributes for modals
-        self.new_name_var = None
-        self.new_addr1_var = None
-        self.new_addr2_var = None
-        self.new_addr3_var = None
-        self.new_city_var = None
-        self.new_state_var = None
-        self.new_zip_var = None
-        self.new_country_var = None
-        self.new_phone_var = None
-        self.update_id_var = None
-        self.update_name_var = None
-        self.update_addr1_var = None
-        self.update_addr2_var = None
-        self.update_addr3_var = None
-        self.update_city_var = None
-        self.update_state_var = None
-        self.update_zip_var = None
-        self.update_country_var = None
-        self.update_phone_var = None
+        # Entries of the modals, by field. The entries are only read
+        # on submit, so they are not bound to StringVars.
+        self.new_entries = None
+        self.update_entries = None
+
+        # Modal windows, built on first use and reused afterwards,
+        # and the client being updated through the update modal
+        self._new_record_modal = None
+        self._update_record_modal = None
+        self._update_client = None
 
         # Initialize tree attribute
         self.tree = None
 
+        # Rows shown in the treeview, by item ID, so that handlers can
+        # use a selected row's values without asking Tk or the record manager.
+        # Each row is identified by its client ID.
+        self._rows_by_item = {}
+
+        # Rows found by previous searches, by lowercased search term.
+        # Cleared whenever a client is created, updated or deleted.
+        self._search_cache = {}
+
+        # Pending search scheduled while typing in the search field
+        self._search_after = None
+
+        # Entry widgets currently showing their placeholder text
+        self._placeholder_entries = set()
+
         # Create the main frame
         self.main_frame = tk.Frame(self.master)
         self.main_frame.pack(fill='both', expand=True)
@@ -69,15 +102,16 @@ class ClientGUI:
         Sets up the treeview with appropriate columns, scrollbars, and event bindings
         for user interaction such as selection, double-click, and keyboard shortcuts.
         """
-        columns = ("ID", "Name", "Address Line 1", "Address Line 2",
-                   "Address Line 3", "City", "State", "Zip Code", "Country", "Phone Number")
+        columns = tuple(col for col, _, _ in self.TREE_COLUMNS)
         self.tree = ttk.Treeview(
             self.client_records_frame, columns=columns, show='headings')
 
-        # Define the column headings
-        for col in columns:
+        # Define the column headings. Each column starts at a width fitting its
+        # values, and only the name and first address line stretch, so resizing
+        # the window does not recompute the width of every column.
+        for col, width, stretch in self.TREE_COLUMNS:
             self.tree.heading(col, text=col)
-            self.tree.column(col, width=100, stretch=True)
+            self.tree.column(col, width=width, minwidth=60, stretch=stretch)
 
         # Add vertical and horizontal scrollbars to the Treeview
         scrollbar_y = ttk.Scrollbar(
@@ -90,11 +124,6 @@ class ClientGUI:
 
         self.tree.pack(side='top', fill='both', expand=True, padx=10, pady=10)
 
-        # Set the background colour of the Treeview
-        style = ttk.Style()
-        style.configure("Treeview", background="#D9D9D9",
-                        fieldbackground="#D9D9D9")
-
         # Bind select event
         self.tree.bind("<<TreeviewSelect>>", self.on_client_select)
 
@@ -122,17 +151,14 @@ class ClientGUI:
         """Change the background colour of the label when it is clicked."""
         event.widget.config(bg='#A3A3A3')
 
-    def button_on_enter(self, event):
-        """Change the background colour of the button when the mouse enters."""
-        event.widget.config(bg='#BFBFBF')
-
-    def button_on_leave(self, event):
-        """Reset the background colour of the button when the mouse leaves."""
-        event.widget.config(bg='#F0F0F0')
-
-    def button_on_click(self, event):
-        """Change the background colour of the button when it is clicked."""
-        event.widget.config(bg='#BFBFBF')
+    def make_button(self, parent, text, command, **pack_options):
+        """
+        Create and pack a button with the given text and command.
+        Its hover and click colours come from the Hover.TButton style.
+        """
+        button = ttk.Button(parent, text=text, command=command, style="Hover.TButton")
+        button.pack(**pack_options)
+        return button
 
     def create_client_records_frame(self):
         """
@@ -156,59 +182,56 @@ class ClientGUI:
         button_frame = tk.Frame(button_search_frame, bg='#CCCCCC')
         button_frame.pack(side='left', padx=5)
 
-        create_button = tk.Button(
-            button_frame, text="Create", command=self.open_new_record_modal)
-        create_button.pack(side='left', padx=20, pady=10)
-        create_button.bind("<Enter>", self.button_on_enter)
-        create_button.bind("<Leave>", self.button_on_leave)
-        create_button.bind("<Button-1>", self.button_on_click)
-
-        update_button = tk.Button(
-            button_frame, text="Update", command=self.open_update_record_modal)
-        update_button.pack(side='left', padx=10, pady=10)
-        update_button.bind("<Enter>", self.button_on_enter)
-        update_button.bind("<Leave>", self.button_on_leave)
-        update_button.bind("<Button-1>", self.button_on_click)
-
-        delete_button = tk.Button(
-            button_frame, text="Delete", command=self.delete_client)
-        delete_button.pack(side='left', padx=20, pady=10)
-        delete_button.bind("<Enter>", self.button_on_enter)
-        delete_button.bind("<Leave>", self.button_on_leave)
-        delete_button.bind("<Button-1>", self.button_on_click)
+        self.make_button(button_frame, "Create", self.open_new_record_modal,
+                         side='left', padx=20, pady=10)
+
+        self.make_button(button_frame, "Update", self.open_update_record_modal,
+                         side='left', padx=10, pady=10)
+
+        self.make_button(button_frame, "Delete", self.delete_client, side='left', padx=20, pady=10)
 
         # Create a frame for search field and button
         search_frame = tk.Frame(button_search_frame, bg='#CCCCCC')
         search_frame.pack(side='right', padx=5)
 
         self.search_var = tk.StringVar()
-        search_field = tk.Entry(search_frame, width=50,
-                                textvariable=self.search_var)
+        self.search_field = search_field = tk.Entry(search_frame, width=50,
+                                                    textvariable=self.search_var)
         self.add_placeholder(search_field, "Search Client Record")
         search_field.pack(side='left', padx=5)
 
         # Add the Clear Search button
-        clear_button = tk.Button(
-            search_frame, text="Clear Search", command=self.clear_search)
-        clear_button.pack(side='right', padx=5, pady=5)
-        clear_button.bind("<Enter>", self.button_on_enter)
-        clear_button.bind("<Leave>", self.button_on_leave)
-        clear_button.bind("<Button-1>", self.button_on_click)
-
-        search_button = tk.Button(
-            search_frame, text="Search", command=self.search_clients)
-        search_button.pack(side='right', padx=30, pady=5)
-        search_button.bind("<Enter>", self.button_on_enter)
-        search_button.bind("<Leave>", self.button_on_leave)
-        search_button.bind("<Button-1>", self.button_on_click)
+        self.make_button(search_frame, "Clear Search", self.clear_search,
+                         side='right', padx=5, pady=5)
+
+        self.make_button(search_frame, "Search", self.search_clients, side='right', padx=30, pady=5)
 
         search_field.bind("<Return>", lambda event: self.search_clients())
+        search_field.bind("<KeyRelease>", self.schedule_search)
+        search_field.bind("<FocusOut>", self.cancel_search, add="+")
 
         # Create a Treeview widget with the specified columns
         self.create_client_treeview()
 
     def open_new_record_modal(self):
         """Open a modal window to create a new client record."""
+        # The modal is built on first use, then hidden and shown again
+        if self._new_record_modal is None:
+            self._new_record_modal = self.build_new_record_modal()
+
+        # Clear the entries of the previous record, restoring their placeholders
+        for field, entry in self.new_entries.items():
+            entry.delete(0, tk.END)
+            entry.config(fg='black')
+            self._placeholder_entries.discard(entry)
+            if field in _NEW_PLACEHOLDERS:
+                entry.insert(0, _NEW_PLACEHOLDERS[field])
+                entry.config(fg='grey')
+                self._placeholder_entries.add(entry)
+        self.show_modal(self._new_record_modal)
+
+    def build_new_record_modal(self):
+        """Build the modal window used to create new client records."""
         # Create a new Toplevel window (modal)
         new_record_modal = tk.Toplevel(self.main_frame)
         new_record_modal.title("New Client Record")
@@ -223,56 +246,17 @@ class ClientGUI:
         input_frame = tk.Frame(new_record_modal)
         input_frame.pack(pady=10, padx=10, fill='both', expand=True)
 
-        # Define the input fields
-        fields = [
-            "Given Name(s)", "Family Name", "Address Line 1", "Address Line 2",
-            "Address Line 3", "City", "State", "Zip Code", "Country", "Phone Number"
-        ]
-
-        placeholders = {
-            "Given Name(s)": "First and middle name",
-            "Address Line 1": "Street name",
-            "Address Line 2": "Street or civic number",
-            "Address Line 3": "Apartment, suite, unit number, PO Box",
-            "Phone Number": "Include country code"
-        }
-
-        # Create entry variables
-        self.new_name_var = tk.StringVar()
-        self.new_addr1_var = tk.StringVar()
-        self.new_addr2_var = tk.StringVar()
-        self.new_addr3_var = tk.StringVar()
-        self.new_city_var = tk.StringVar()
-        self.new_state_var = tk.StringVar()
-        self.new_zip_var = tk.StringVar()
-        self.new_country_var = tk.StringVar()
-        self.new_phone_var = tk.StringVar()
-
-        entry_vars = {
-            "Given Name(s)": self.new_name_var,
-            "Family Name": tk.StringVar(),  # This will be combined with Given Name(s)
-            "Address Line 1": self.new_addr1_var,
-            "Address Line 2": self.new_addr2_var,
-            "Address Line 3": self.new_addr3_var,
-            "City": self.new_city_var,
-            "State": self.new_state_var,
-            "Zip Code": self.new_zip_var,
-            "Country": self.new_country_var,
-            "Phone Number": self.new_phone_var
-        }
-
         # Add input fields to the frame, two fields per line
-        entries = {}
-        for i, field in enumerate(fields):
+        self.new_entries = {}
+        for (row, column), field in zip(_FIELD_POSITIONS, _NEW_FIELDS):
             label = tk.Label(input_frame, text=f"{field}:")
-            label.grid(row=i//2, column=(i % 2)*2, sticky='e', pady=5, padx=5)
-            entry = tk.Entry(input_frame, width=30,
-                             textvariable=entry_vars[field])
-            entry.grid(row=i//2, column=(i % 2)*2+1,
+            label.grid(row=row, column=column, sticky='e', pady=5, padx=5)
+            entry = tk.Entry(input_frame, width=30)
+            entry.grid(row=row, column=column + 1,
                        pady=5, padx=5, sticky='ew')
-            entries[field] = entry
-            if field in placeholders:
-                self.add_placeholder(entry, placeholders[field])
+            self.new_entries[field] = entry
+            if field in _NEW_PLACEHOLDERS:
+                self.add_placeholder(entry, _NEW_PLACEHOLDERS[field])
 
         # Make the input fields responsive
         for i in range(2):
@@ -283,25 +267,19 @@ class ClientGUI:
         button_frame.pack(pady=10)
 
         # Add Create and Cancel buttons
-        create_button = tk.Button(button_frame, text="Create",
-                                  command=lambda: self.create_client_from_modal(
-                                      entries, new_record_modal))
-        create_button.pack(side='left', padx=5)
-        create_button.bind("<Enter>", self.button_on_enter)
-        create_button.bind("<Leave>", self.button_on_leave)
-        create_button.bind("<Button-1>", self.button_on_click)
-
-        cancel_button = tk.Button(
-            button_frame, text="Cancel", command=new_record_modal.destroy)
-        cancel_button.pack(side='left', padx=5)
-        cancel_button.bind("<Enter>", self.button_on_enter)
-        cancel_button.bind("<Leave>", self.button_on_leave)
-        cancel_button.bind("<Button-1>", self.button_on_click)
-
-        # Make the modal window modal (block interaction with the main window)
+        self.make_button(button_frame, "Create",
+                         lambda: self.create_client_from_modal(
+                             self.new_entries, new_record_modal),
+                         side='left', padx=5)
+
+        self.make_button(button_frame, "Cancel", lambda: self.hide_modal(new_record_modal),
+                         side='left', padx=5)
+
+        # Closing the window hides it too, so that it can be shown again
+        new_record_modal.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_modal(new_record_modal))
         new_record_modal.transient(self.main_frame)
-        new_record_modal.grab_set()
-        self.main_frame.wait_window(new_record_modal)
+        return new_record_modal
 
     def open_update_record_modal(self):
         """Open a modal window to update an existing client record."""
@@ -312,118 +290,99 @@ class ClientGUI:
                 "Warning", "Please select a client to update")
             return
 
-        # Get the selected client
+        # Get the selected client from the row's values
         selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
 
         try:
-            client = self.record_manager.get_client(int(values[0]))
-            if not client:
-                messagebox.showwarning("Warning", "Selected client not found")
-                return
-
-            # Create a new Toplevel window (modal)
-            update_record_modal = tk.Toplevel(self.main_frame)
-            update_record_modal.title("Update Record")
-            self.center_window(update_record_modal, 700, 300)
-
-            # Add a label to the modal
-            label = tk.Label(update_record_modal,
-                             text="Update Record", font=('Arial', 14))
-            label.pack(pady=10)
-
-            # Create a frame for the input fields
-            input_frame = tk.Frame(update_record_modal)
-            input_frame.pack(pady=10, padx=10, fill='both', expand=True)
-
-            # Define the input fields
-            fields = [
-                "ID", "Name", "Address Line 1", "Address Line 2",
-                "Address Line 3", "City", "State", "Zip Code", "Country", "Phone Number"
-            ]
-
-            # Create entry variables and set values teassign StringVar instances with values
-            self.update_id_var = tk.StringVar(value=client.get_id())
-            self.update_name_var = tk.StringVar(value=client.get_name())
-            self.update_addr1_var = tk.StringVar(
-                value=client.get_address_line_1())
-            self.update_addr2_var = tk.StringVar(
-                value=client.get_address_line_2())
-            self.update_addr3_var = tk.StringVar(
-                value=client.get_address_line_3())
-            self.update_city_var = tk.StringVar(value=client.get_city())
-            self.update_state_var = tk.StringVar(value=client.get_state())
-            self.update_zip_var = tk.StringVar(value=client.get_zip_code())
-            self.update_country_var = tk.StringVar(value=client.get_country())
-            self.update_phone_var = tk.StringVar(
-                value=client.get_phone_number())
-
-            entry_vars = {
-                "ID": self.update_id_var,
-                "Name": self.update_name_var,
-                "Address Line 1": self.update_addr1_var,
-                "Address Line 2": self.update_addr2_var,
-                "Address Line 3": self.update_addr3_var,
-                "City": self.update_city_var,
-                "State": self.update_state_var,
-                "Zip Code": self.update_zip_var,
-                "Country": self.update_country_var,
-                "Phone Number": self.update_phone_var
-            }
-
-            # Add input fields to the frame, two fields per line
-            for i, field in enumerate(fields):
-                label = tk.Label(input_frame, text=f"{field}:")
-                label.grid(row=i//2, column=(i % 2)*2,
-                           sticky='e', pady=5, padx=5)
-                entry = tk.Entry(input_frame, width=30,
-                                 textvariable=entry_vars[field])
-                if field == "ID":
-                    entry.config(state='readonly')
-                entry.grid(row=i//2, column=(i % 2)*2+1,
-                           pady=5, padx=5, sticky='ew')
-
-            # Make the input fields responsive
-            for i in range(2):
-                input_frame.grid_columnconfigure(i*2+1, weight=1)
-
-            # Create a frame for the buttons
-            button_frame = tk.Frame(update_record_modal)
-            button_frame.pack(pady=10)
-
-            # Add Update and Cancel buttons
-            update_button = tk.Button(button_frame, text="Update",
-                                      command=lambda: self.update_client_from_modal(
-                                          client, update_record_modal))
-            update_button.pack(side='left', padx=5)
-            update_button.bind("<Enter>", self.button_on_enter)
-            update_button.bind("<Leave>", self.button_on_leave)
-            update_button.bind("<Button-1>", self.button_on_click)
-
-            cancel_button = tk.Button(
-                button_frame, text="Cancel", command=update_record_modal.destroy)
-            cancel_button.pack(side='left', padx=5)
-            cancel_button.bind("<Enter>", self.button_on_enter)
-            cancel_button.bind("<Leave>", self.button_on_leave)
-            cancel_button.bind("<Button-1>", self.button_on_click)
-
-            # Make the modal window modal (block interaction with the main window)
-            update_record_modal.transient(self.main_frame)
-            update_record_modal.grab_set()
-            self.main_frame.wait_window(update_record_modal)
+            client = self.client_from_row(selected_item)
+
+            # The modal is built on first use, then hidden and shown again
+            if self._update_record_modal is None:
+                self._update_record_modal = self.build_update_record_modal()
+
+            # Fill the entries with the selected client's values, which the
+            # row holds in field order. The ID entry is made writable to do so.
+            self._update_client = client
+            for entry, value in zip(self.update_entries.values(), client.as_row_tuple()):
+                entry.config(state='normal')
+                entry.delete(0, tk.END)
+                entry.insert(0, value)
+            self.update_entries["ID"].config(state='readonly')
+            self.show_modal(self._update_record_modal)
 
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror(
                 "Error", f"Failed to open update modal: {str(e)}")
 
+    def build_update_record_modal(self):
+        """Build the modal window used to update client records."""
+        # Create a new Toplevel window (modal)
+        update_record_modal = tk.Toplevel(self.main_frame)
+        update_record_modal.title("Update Record")
+        self.center_window(update_record_modal, 700, 300)
+
+        # Add a label to the modal
+        label = tk.Label(update_record_modal,
+                         text="Update Record", font=('Arial', 14))
+        label.pack(pady=10)
+
+        # Create a frame for the input fields
+        input_frame = tk.Frame(update_record_modal)
+        input_frame.pack(pady=10, padx=10, fill='both', expand=True)
+
+        # Add input fields to the frame, two fields per line. They are
+        # filled each time the modal is opened.
+        self.update_entries = {}
+        for (row, column), field in zip(_FIELD_POSITIONS, _UPDATE_FIELDS):
+            label = tk.Label(input_frame, text=f"{field}:")
+            label.grid(row=row, column=column,
+                       sticky='e', pady=5, padx=5)
+            entry = tk.Entry(input_frame, width=30)
+            entry.grid(row=row, column=column + 1,
+                       pady=5, padx=5, sticky='ew')
+            self.update_entries[field] = entry
+
+        # Make the input fields responsive
+        for i in range(2):
+            input_frame.grid_columnconfigure(i*2+1, weight=1)
+
+        # Create a frame for the buttons
+        button_frame = tk.Frame(update_record_modal)
+        button_frame.pack(pady=10)
+
+        # Add Update and Cancel buttons. The client being updated
+        # is the one stored when the modal was last opened.
+        self.make_button(button_frame, "Update",
+                         lambda: self.update_client_from_modal(
+                             self._update_client, update_record_modal),
+                         side='left', padx=5)
+
+        self.make_button(button_frame, "Cancel", lambda: self.hide_modal(update_record_modal),
+                         side='left', padx=5)
+
+        # Closing the window hides it too, so that it can be shown again
+        update_record_modal.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_modal(update_record_modal))
+        update_record_modal.transient(self.main_frame)
+        return update_record_modal
+
+    def show_modal(self, modal):
+        """Show a modal window, blocking interaction with the main window."""
+        modal.deiconify()
+        modal.lift()
+        modal.grab_set()
+
+    def hide_modal(self, modal):
+        """Hide a modal window, keeping it to be shown again."""
+        modal.grab_release()
+        modal.withdraw()
+
     def create_client_from_modal(self, entries, modal):
         """Create a new client record from the modal form."""
         try:
             # Get values from entries, replacing placeholders with empty strings
-            given_name = self.get_entry_value(
-                entries["Given Name(s)"], "First and Middle Name")
-            family_name = self.get_entry_value(
-                entries["Family Name"], "Last Name")
+            given_name = self.get_entry_value(entries["Given Name(s)"])
+            family_name = self.get_entry_value(entries["Family Name"])
 
             # Combine and check if empty
             name = f"{given_name} {family_name}".strip()
@@ -439,30 +398,25 @@ class ClientGUI:
             client = Client(
                 id_number=next_id,
                 name=name,
-                address_line_1=self.get_entry_value(
-                    entries["Address Line 1"], "Street name"),
-                address_line_2=self.get_entry_value(
-                    entries["Address Line 2"], "Street or civic number"),
-                address_line_3=self.get_entry_value(
-                    entries["Address Line 3"], "Apartment, suite, unit number, PO Box"),
-                city=self.get_entry_value(entries["City"], "City"),
-                state=self.get_entry_value(
-                    entries["State"], "State or Province"),
-                zip_code=self.get_entry_value(
-                    entries["Zip Code"], "Zip or Postal Code"),
-                country=self.get_entry_value(entries["Country"], "Country"),
-                phone_number=self.get_entry_value(
-                    entries["Phone Number"], "Include country code")
+                address_line_1=self.get_entry_value(entries["Address Line 1"]),
+                address_line_2=self.get_entry_value(entries["Address Line 2"]),
+                address_line_3=self.get_entry_value(entries["Address Line 3"]),
+                city=self.get_entry_value(entries["City"]),
+                state=self.get_entry_value(entries["State"]),
+                zip_code=self.get_entry_value(entries["Zip Code"]),
+                country=self.get_entry_value(entries["Country"]),
+                phone_number=self.get_entry_value(entries["Phone Number"])
             )
 
             # Add client to record manager
             self.record_manager.create_client(client)
+            self._search_cache.clear()
 
             # Refresh client list
             self.load_clients()
 
             # Close the modal
-            modal.destroy()
+            self.hide_modal(modal)
 
             messagebox.showinfo(
                 "Success", f"Client {client.get_name()} created successfully!")
@@ -473,24 +427,26 @@ class ClientGUI:
         """Update an existing client record from the modal form."""
         try:
             # Update client attributes
-            client.set_name(self.update_name_var.get())
-            client.set_address_line_1(self.update_addr1_var.get())
-            client.set_address_line_2(self.update_addr2_var.get())
-            client.set_address_line_3(self.update_addr3_var.get())
-            client.set_city(self.update_city_var.get())
-            client.set_state(self.update_state_var.get())
-            client.set_zip_code(self.update_zip_var.get())
-            client.set_country(self.update_country_var.get())
-            client.set_phone_number(self.update_phone_var.get())
+            entries = self.update_entries
+            client.set_name(entries["Name"].get())
+            client.set_address_line_1(entries["Address Line 1"].get())
+            client.set_address_line_2(entries["Address Line 2"].get())
+            client.set_address_line_3(entries["Address Line 3"].get())
+            client.set_city(entries["City"].get())
+            client.set_state(entries["State"].get())
+            client.set_zip_code(entries["Zip Code"].get())
+            client.set_country(entries["Country"].get())
+            client.set_phone_number(entries["Phone Number"].get())
 
             # Update client in record manager
             self.record_manager.update_client(client)
+            self._search_cache.clear()
 
             # Refresh client list
             self.load_clients()
 
             # Close the modal
-            modal.destroy()
+            self.hide_modal(modal)
 
             messagebox.showinfo(
                 "Success", f"Client {client.get_name()} updated successfully!")
@@ -506,29 +462,29 @@ class ClientGUI:
                 "Warning", "Please select a client to delete")
             return
 
-        # Get the selected client
+        # Get the selected client from the row's values. The row's
+        # item ID is the client's ID.
         selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
 
         try:
-            client_id = int(values[0])
-            client = self.record_manager.get_client(client_id)
+            client_id = int(selected_item)
+            client = self.client_from_row(selected_item)
 
-            if client:
-                confirm = messagebox.askyesno(
-                    "Confirm Delete",
-                    f"Are you sure you want to delete client "
-                    f"{client.get_name()}?")
+            confirm = messagebox.askyesno(
+                "Confirm Delete",
+                f"Are you sure you want to delete client "
+                f"{client.get_name()}?")
 
-                if confirm:
-                    # Delete client from record manager
-                    self.record_manager.delete_client(client_id)
+            if confirm:
+                # Delete client from record manager
+                self.record_manager.delete_client(client_id)
+                self._search_cache.clear()
 
-                    # Refresh client list
-                    self.load_clients()
+                # Refresh client list
+                self.load_clients()
 
-                    messagebox.showinfo(
-                        "Success", "Client deleted successfully!")
+                messagebox.showinfo(
+                    "Success", "Client deleted successfully!")
         except ValueError as e:
             if "associated flights" in str(e):
                 messagebox.showwarning(
@@ -542,9 +498,31 @@ class ClientGUI:
             messagebox.showerror(
                 "Error", f"Failed to delete client: {str(e)}")
 
+    def schedule_search(self, event=None):  # pylint: disable=W0613
+        """
+        Search for clients shortly after the user stops typing.
+        Each key press reschedules the search, so a burst of typing
+        runs a single search for the final term. Keys that leave the
+        text unchanged, such as Return, Tab and the arrows, are ignored.
+        """
+        if event is not None and event.keysym in _NON_EDITING_KEYS:
+            return
+        self.cancel_search()
+        self._search_after = self.master.after(150, self.search_clients)
+
+    def cancel_search(self, event=None):  # pylint: disable=W0613
+        """Cancel the search scheduled while typing, if any."""
+        if self._search_after is not None:
+            self.master.after_cancel(self._search_after)
+            self._search_after = None
+
     def search_clients(self):
         """Search for clients based on the search term."""
-        search_term = self.search_var.get()
+        # A search run now makes any scheduled one redundant
+        self.cancel_search()
+
+        # The placeholder shown in the search field is not a search term
+        search_term = self.get_entry_value(self.search_field)
 
         if not search_term:
             # If search term is empty, load all clients
@@ -552,57 +530,51 @@ class ClientGUI:
             return
 
         try:
-            # Search clients by name, city, or country
-            clients = self.record_manager.search_clients(search_term)
-
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Add search results to treeview
-            for client in clients:
-                self.tree.insert("", "end", values=(
-                    client.get_id(),
-                    client.get_name(),
-                    client.get_address_line_1(),
-                    client.get_address_line_2(),
-                    client.get_address_line_3(),
-                    client.get_city(),
-                    client.get_state(),
-                    client.get_zip_code(),
-                    client.get_country(),
-                    client.get_phone_number()
-                ))
+            # Search clients by any field. Searches are case-insensitive,
+            # so the rows found are reused for any repeat of the same term.
+            cache_key = search_term.lower()
+            rows = self._search_cache.get(cache_key)
+            if rows is None:
+                clients = self.record_manager.search_clients(search_term)
+                rows = self._search_cache[cache_key] = [
+                    client.as_row_tuple() for client in clients]
+
+            # Replace the rows of the treeview with the search results
+            self.fill_tree(rows)
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror("Error", f"Search failed: {str(e)}")
 
     def load_clients(self):
         """Load all clients from the record manager into the treeview."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Get all clients from record manager
-        clients = []
-        for record in self.record_manager.records:
-            if record.get("Type") == "client":
-                client = self.record_manager.get_client(record.get("ID"))
-                clients.append(client)
-
-        # Add clients to treeview
-        for client in clients:
-            self.tree.insert("", "end", values=(
-                client.get_id(),
-                client.get_name(),
-                client.get_address_line_1(),
-                client.get_address_line_2(),
-                client.get_address_line_3(),
-                client.get_city(),
-                client.get_state(),
-                client.get_zip_code(),
-                client.get_country(),
-                client.get_phone_number()
-            ))
+        # Get all clients from record manager, without an intermediate list
+        clients = self.record_manager.iter_clients()
+
+        # Replace the rows of the treeview with all the clients
+        self.fill_tree([client.as_row_tuple() for client in clients])
+
+    def fill_tree(self, rows):
+        """
+        Replace the rows of the treeview with the given rows.
+
+        Each row is identified by its client ID, which is used as the
+        treeview item ID. All existing items, known from the rows shown,
+        are deleted with a single call, and all the rows are inserted with
+        another, through the Tcl procedure shared by the record GUIs.
+        Tk redraws the treeview once, when idle.
+        """
+        if self._rows_by_item:
+            self.tree.delete(*self._rows_by_item)
+        self._rows_by_item = {str(row[0]): row for row in rows}
+        if rows:
+            append_rows(self.tree, self._rows_by_item, rows)
+
+    def client_from_row(self, item):
+        """
+        Create a client from the values of the given treeview item.
+        The row holds all the client's fields, in column order, as
+        read from the stored records, so the setters are skipped.
+        """
+        return Client.from_trusted_row(self._rows_by_item[item])
 
     def on_client_select(self, event):  # pylint: disable=W0613
         """Handle client selection in the treeview."""
@@ -615,11 +587,10 @@ class ClientGUI:
 
         # Get the first selected item
         selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
 
         try:
-            # Get client from record manager
-            client = self.record_manager.get_client(int(values[0]))
+            # Create the client from the row's values
+            client = self.client_from_row(selected_item)
 
             # Store the selected client for later use
             self.selected_client = client
@@ -630,14 +601,20 @@ class ClientGUI:
         """Add a placeholder to the given entry widget."""
         entry.insert(0, placeholder)
         entry.config(fg='grey')
-        entry.bind("<FocusIn>", lambda event: self.clear_placeholder(
-            event, placeholder))
+        self._placeholder_entries.add(entry)
+        entry.bind("<FocusIn>", self.clear_placeholder)
         entry.bind("<FocusOut>", lambda event: self.set_placeholder(
             event, placeholder))
 
-    def clear_placeholder(self, event, placeholder):
-        """Clear the placeholder from the given entry widget."""
-        if event.widget.get() == placeholder:
+    def clear_placeholder(self, event):
+        """
+        Clear the placeholder from the given entry widget.
+
+        Entries showing their placeholder are tracked in a set, so that
+        text typed by the user is never mistaken for the placeholder.
+        """
+        if event.widget in self._placeholder_entries:
+            self._placeholder_entries.discard(event.widget)
             event.widget.delete(0, tk.END)
             event.widget.config(fg='black')
 
@@ -646,6 +623,7 @@ class ClientGUI:
         if not event.widget.get():
             event.widget.insert(0, placeholder)
             event.widget.config(fg='grey')
+            self._placeholder_entries.add(event.widget)
 
     def center_window(self, window, width, height):
         """Center the given window on the screen."""
@@ -660,20 +638,12 @@ class ClientGUI:
         self.search_var.set("")
         self.load_clients()
 
-    def is_placeholder(self, entry, placeholder):
+    def is_placeholder(self, entry):
         """Check if the entry contains placeholder text."""
-        entry_text = entry.get().strip()
-        entry_color = entry.cget('fg')
-
-        # More robust color check
-        is_grey = entry_color.lower() in [
-            'grey', 'gray'] or entry_color == '#808080'
-
-        # Case-insensitive comparison of text
-        return entry_text.lower() == placeholder.lower() and is_grey
+        return entry in self._placeholder_entries
 
-    def get_entry_value(self, entry, placeholder):
+    def get_entry_value(self, entry):
         """Get the actual value from an entry, ignoring placeholder text."""
-        if self.is_placeholder(entry, placeholder):
+        if self.is_placeholder(entry):
             return ""
         return entry.get().strip()  # Strip whitespace from actual values
@@ -7,12 +7,34 @@ including creating, reading, updating, and deleting flight information.
 
 # Imports
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import DateEntry
 from data.flight import Flight
-from data.client import Client
-from data.airline import Airline
+from .treeview_rows import append_rows
+
+
+@lru_cache(maxsize=10000)
+def _naive_display_date(date):
+    """
+    Format the naive date of a flight for display, without the time.
+    Memoized, since flights share dates, and parsed dates are
+    shared between the flights stored with the same date string.
+    """
+    return date.strftime("%Y-%m-%d")
+
+
+def _display_date(date):
+    """
+    Format the date of a flight for display, without the time.
+    Only naive dates are formatted through the cache: aware dates in
+    different zones can compare equal while falling on different days.
+    """
+    if date.tzinfo is None:
+        return _naive_display_date(date)
+    return date.strftime("%Y-%m-%d")
 
 
 class FlightGUI:
@@ -51,6 +73,40 @@ class FlightGUI:
         self.selected_airline_id = None
         self.selected_date = None
 
+        # Modal windows, built on first use and reused afterwards, their
+        # date entries, and the flight being updated through the update modal
+        self._new_record_modal = None
+        self._update_record_modal = None
+        self._new_date_entry = None
+        self._update_date_entry = None
+        self._update_flight = None
+
+        # Date entry of the search fields, set when they are created
+        self._search_date_entry = None
+
+        # Pending search scheduled while typing in the city search fields
+        self._search_after = None
+
+        # Choices of the client and airline combo boxes, with the record
+        # manager's version of the records they were built from, and the
+        # version of the choices shown by each combo box, by widget name.
+        self._client_choices = (None, ())
+        self._airline_choices = (None, ())
+        # Names of the clients and airlines by ID, with the versions
+        # of the records they were read from
+        self._client_names = (None, {})
+        self._airline_names = (None, {})
+        self._combo_versions = {}
+        # Display rows of all the flights and the flights themselves, with
+        # the versions of the records they were built from
+        self._flight_rows = (None, (), ())
+        # Rows and flights found by each search, with the versions of
+        # the records they were built from
+        self._search_cache = (None, {})
+        # Row and flight shown by each item of the treeview, by item ID
+        self._shown_rows = {}
+        self._flights_by_item = {}
+
         # Create UI elements
         self.create_flight_records_frame()
 
@@ -58,8 +114,10 @@ class FlightGUI:
         self.flight_records_frame.pack(
             side='top', fill='both', expand=True, padx=10, pady=10)
 
-        # Load existing flights
-        self.load_flights()
+        # Load existing flights once Tk is idle. Redraws are idle callbacks
+        # too, and the ones already queued run first, so the window is shown
+        # before the flights, the largest set of records, are loaded.
+        self.master.after_idle(self.load_flights)
 
     def on_enter(self, event):
         """Change the background colour of the label when the mouse enters."""
@@ -73,18 +131,6 @@ class FlightGUI:
         """Change the background colour of the label when it is clicked."""
         event.widget.config(bg='#A3A3A3')
 
-    def button_on_enter(self, event):
-        """Change the background colour of the button when the mouse enters."""
-        event.widget.config(bg='#BFBFBF')
-
-    def button_on_leave(self, event):
-        """Reset the background colour of the button when the mouse leaves."""
-        event.widget.config(bg='#F0F0F0')
-
-    def button_on_click(self, event):
-        """Change the background colour of the button when it is clicked."""
-        event.widget.config(bg='#BFBFBF')
-
     def create_flight_records_frame(self):
         """
         Create the main frame for displaying flight records.
@@ -107,26 +153,20 @@ class FlightGUI:
         button_frame = tk.Frame(button_search_frame, bg='#CCCCCC')
         button_frame.pack(side='left', padx=5)
 
-        create_button = tk.Button(
-            button_frame, text="Create", command=self.open_new_record_modal)
+        create_button = ttk.Button(
+            button_frame, text="Create", command=self.open_new_record_modal,
+            style="Hover.TButton")
         create_button.pack(side='left', padx=20, pady=10)
-        create_button.bind("<Enter>", self.button_on_enter)
-        create_button.bind("<Leave>", self.button_on_leave)
-        create_button.bind("<Button-1>", self.button_on_click)
 
-        update_button = tk.Button(
-            button_frame, text="Update", command=self.open_update_record_modal)
+        update_button = ttk.Button(
+            button_frame, text="Update", command=self.open_update_record_modal,
+            style="Hover.TButton")
         update_button.pack(side='left', padx=10, pady=10)
-        update_button.bind("<Enter>", self.button_on_enter)
-        update_button.bind("<Leave>", self.button_on_leave)
-        update_button.bind("<Button-1>", self.button_on_click)
 
-        delete_button = tk.Button(
-            button_frame, text="Delete", command=self.delete_flight)
+        delete_button = ttk.Button(
+            button_frame, text="Delete", command=self.delete_flight,
+            style="Hover.TButton")
         delete_button.pack(side='left', padx=20, pady=10)
-        delete_button.bind("<Enter>", self.button_on_enter)
-        delete_button.bind("<Leave>", self.button_on_leave)
-        delete_button.bind("<Button-1>", self.button_on_click)
 
         # Create a frame for search fields and button
         search_frame = tk.Frame(button_search_frame, bg='#CCCCCC')
@@ -139,6 +179,7 @@ class FlightGUI:
             search_frame, textvariable=self.search_start_var, width=20)
         start_entry.grid(row=0, column=1, padx=5, pady=5)
         start_entry.bind("<Return>", lambda event: self.search_flights())
+        start_entry.bind("<KeyRelease>", self.schedule_search)
 
         ttk.Label(search_frame, text="End City:").grid(
             row=0, column=2, padx=5, pady=5)
@@ -146,15 +187,17 @@ class FlightGUI:
             search_frame, textvariable=self.search_end_var, width=20)
         end_entry.grid(row=0, column=3, padx=5, pady=5)
         end_entry.bind("<Return>", lambda event: self.search_flights())
+        end_entry.bind("<KeyRelease>", self.schedule_search)
 
         ttk.Label(search_frame, text="Date:").grid(
             row=0, column=4, padx=5, pady=5)
-        date_entry = DateEntry(search_frame, width=20, background='darkblue',
-                               foreground='white', borderwidth=2, date_pattern='yyyy-mm-dd',
-                               textvariable=self.search_date_var)
-        date_entry.delete(0, 'end')  # Clear the default date
-        date_entry.grid(row=0, column=5, padx=5, pady=5)
-        date_entry.bind("<Return>", lambda event: self.search_flights())
+        self._search_date_entry = DateEntry(search_frame, width=20, background='darkblue',
+                                            foreground='white', borderwidth=2,
+                                            date_pattern='yyyy-mm-dd',
+                                            textvariable=self.search_date_var)
+        self._search_date_entry.delete(0, 'end')  # Clear the default date
+        self._search_date_entry.grid(row=0, column=5, padx=5, pady=5)
+        self._search_date_entry.bind("<Return>", lambda event: self.search_flights())
 
         # Add client and airline dropdowns (second row)
         ttk.Label(search_frame, text="Client:").grid(
@@ -165,7 +208,6 @@ class FlightGUI:
             postcommand=lambda: self.populate_client_combo(client_combo))
         client_combo.grid(row=1, column=1, columnspan=2,
                           padx=5, pady=5, sticky='ew')
-        self.populate_client_combo(client_combo)
         client_combo.set("")  # Default empty selection
 
         ttk.Label(search_frame, text="Airline:").grid(
@@ -176,23 +218,18 @@ class FlightGUI:
             postcommand=lambda: self.populate_airline_combo(airline_combo))
         airline_combo.grid(row=1, column=4, columnspan=2,
                            padx=5, pady=5, sticky='ew')
-        self.populate_airline_combo(airline_combo)
         airline_combo.set("")  # Default empty selection
 
         # Add search and clear buttons (second row)
-        search_button = tk.Button(
-            search_frame, text="Search", command=self.search_flights)
+        search_button = ttk.Button(
+            search_frame, text="Search", command=self.search_flights,
+            style="Hover.TButton")
         search_button.grid(row=1, column=6, padx=5, pady=5)
-        search_button.bind("<Enter>", self.button_on_enter)
-        search_button.bind("<Leave>", self.button_on_leave)
-        search_button.bind("<Button-1>", self.button_on_click)
 
-        clear_button = tk.Button(
-            search_frame, text="Clear Search", command=self.clear_search_fields)
+        clear_button = ttk.Button(
+            search_frame, text="Clear Search", command=self.clear_search_fields,
+            style="Hover.TButton")
         clear_button.grid(row=1, column=7, padx=5, pady=5)
-        clear_button.bind("<Enter>", self.button_on_enter)
-        clear_button.bind("<Leave>", self.button_on_leave)
-        clear_button.bind("<Button-1>", self.button_on_click)
 
         # Create a Treeview widget with the specified columns
         self.create_flight_treeview()
@@ -205,10 +242,9 @@ class FlightGUI:
         self.search_client_var.set('')
         self.search_airline_var.set('')
 
-        # Reset the DateEntry widget to its default state
-        for widget in self.flight_records_frame.winfo_children():
-            if isinstance(widget, DateEntry):
-                widget.set_date(datetime.now())
+        # Reset the date search field's calendar to today, leaving the field empty
+        self._search_date_entry.set_date(datetime.now())
+        self._search_date_entry.delete(0, 'end')
 
         self.load_flights()
 
@@ -238,11 +274,6 @@ class FlightGUI:
 
         self.tree.pack(side='top', fill='both', expand=True, padx=10, pady=10)
 
-        # Set the background colour of the Treeview
-        style = ttk.Style()
-        style.configure("Treeview", background="#D9D9D9",
-                        fieldbackground="#D9D9D9")
-
         # Bind select event
         self.tree.bind("<<TreeviewSelect>>", self.on_flight_select)
 
@@ -259,13 +290,20 @@ class FlightGUI:
 
     def open_new_record_modal(self):
         """Open a modal window to create a new flight record."""
-        # Reset input variables
+        # The modal is built on first use, then hidden and shown again
+        if self._new_record_modal is None:
+            self._new_record_modal = self.build_new_record_modal()
+
+        # Reset input variables, with the date set back to today
         self.client_var.set('')
         self.airline_var.set('')
-        self.date_var.set('')
         self.start_city_var.set('')
         self.end_city_var.set('')
+        self._new_date_entry.set_date(datetime.now())
+        self.show_modal(self._new_record_modal)
 
+    def build_new_record_modal(self):
+        """Build the modal window used to create new flight records."""
         # Create a new Toplevel window (modal)
         new_record_modal = tk.Toplevel(self.main_frame)
         new_record_modal.title("New Flight Record")
@@ -288,7 +326,6 @@ class FlightGUI:
             state="readonly",
             postcommand=lambda: self.populate_client_combo(client_combo))
         client_combo.grid(row=0, column=1, pady=5, padx=5, sticky='ew')
-        self.populate_client_combo(client_combo)
 
         airline_id_label = tk.Label(input_frame, text="Airline:")
         airline_id_label.grid(row=0, column=2, sticky='e', pady=5, padx=5)
@@ -297,15 +334,15 @@ class FlightGUI:
             state="readonly",
             postcommand=lambda: self.populate_airline_combo(airline_combo))
         airline_combo.grid(row=0, column=3, pady=5, padx=5, sticky='ew')
-        self.populate_airline_combo(airline_combo)
 
         # Date field
         date_label = tk.Label(input_frame, text="Date:")
         date_label.grid(row=1, column=0, sticky='e', pady=5, padx=5)
-        date_entry = DateEntry(input_frame, width=12, background='darkblue',
-                               foreground='white', borderwidth=2, date_pattern='yyyy-mm-dd',
-                               textvariable=self.date_var)
-        date_entry.grid(row=1, column=1, pady=5, padx=5, sticky='ew')
+        self._new_date_entry = DateEntry(input_frame, width=12, background='darkblue',
+                                         foreground='white', borderwidth=2,
+                                         date_pattern='yyyy-mm-dd',
+                                         textvariable=self.date_var)
+        self._new_date_entry.grid(row=1, column=1, pady=5, padx=5, sticky='ew')
 
         # Start City field
         start_city_label = tk.Label(input_frame, text="Start City:")
@@ -330,24 +367,20 @@ class FlightGUI:
         button_frame.pack(pady=10)
 
         # Add Create and Cancel buttons
-        create_button = tk.Button(button_frame, text="Create",
-                                  command=lambda: self.create_flight_from_modal(new_record_modal))
+        create_button = ttk.Button(button_frame, text="Create", style="Hover.TButton",
+                                   command=lambda: self.create_flight_from_modal(new_record_modal))
         create_button.pack(side='left', padx=5)
-        create_button.bind("<Enter>", self.button_on_enter)
-        create_button.bind("<Leave>", self.button_on_leave)
-        create_button.bind("<Button-1>", self.button_on_click)
 
-        cancel_button = tk.Button(
-            button_frame, text="Cancel", command=new_record_modal.destroy)
+        cancel_button = ttk.Button(
+            button_frame, text="Cancel", command=lambda: self.hide_modal(new_record_modal),
+            style="Hover.TButton")
         cancel_button.pack(side='left', padx=5)
-        cancel_button.bind("<Enter>", self.button_on_enter)
-        cancel_button.bind("<Leave>", self.button_on_leave)
-        cancel_button.bind("<Button-1>", self.button_on_click)
 
-        # Make the modal window modal (block interaction with the main window)
+        # Closing the window hides it too, so that it can be shown again
+        new_record_modal.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_modal(new_record_modal))
         new_record_modal.transient(self.main_frame)
-        new_record_modal.grab_set()
-        self.main_frame.wait_window(new_record_modal)
+        return new_record_modal
 
     def open_update_record_modal(self):
         """Open a modal window to update an existing flight record."""
@@ -358,124 +391,126 @@ class FlightGUI:
             return
 
         try:
-            # Get values from the selected flight record
-            client_id = self.selected_flight.get("Client_ID")
-            airline_id = self.selected_flight.get("Airline_ID")
-            date_str = self.selected_flight.get("Date")
-            start_city = self.selected_flight.get("Start City")
-            end_city = self.selected_flight.get("End City")
-
-            # Create Flight object from the record
-            flight = Flight.from_dict(self.selected_flight)
-
-            # Create a new Toplevel window (modal)
-            update_record_modal = tk.Toplevel(self.main_frame)
-            update_record_modal.title("Update Flight Record")
-            self.center_window(update_record_modal, 700, 200)
-
-            # Add a label to the modal
-            label = tk.Label(update_record_modal,
-                             text="Update Flight Record", font=('Arial', 14))
-            label.pack(pady=10)
-
-            # Create a frame for the input fields
-            input_frame = tk.Frame(update_record_modal)
-            input_frame.pack(pady=10, padx=10, fill='both', expand=True)
+            # Get values from the selected flight
+            flight = self.selected_flight
+            client_id = flight.get_client_id()
+            airline_id = flight.get_airline_id()
 
-            # Get client and airline names for display
-            client = self.record_manager.get_client(client_id)
-            airline = self.record_manager.get_airline(airline_id)
-            client_name = client.get_name() if client else "Unknown"
-            airline_name = airline.get_company_name() if airline else "Unknown"
+            # The modal is built on first use, then hidden and shown again
+            if self._update_record_modal is None:
+                self._update_record_modal = self.build_update_record_modal()
 
-            # Format date for display - extract just the date part if ISO format
-            display_date = date_str.split(
-                "T")[0] if "T" in date_str else date_str
+            # Get client and airline names for display
+            client_name = self.get_client_names().get(client_id, "Unknown")
+            airline_name = self.get_airline_names().get(airline_id, "Unknown")
 
             # Set current values
+            self._update_flight = flight
             self.client_var.set(f"{client_id} - {client_name}")
             self.airline_var.set(f"{airline_id} - {airline_name}")
-            self.date_var.set(display_date)
-            self.start_city_var.set(start_city)
-            self.end_city_var.set(end_city)
-
-            # Add combo boxes for Client ID and Airline ID
-            client_id_label = tk.Label(input_frame, text="Client:")
-            client_id_label.grid(row=0, column=0, sticky='e', pady=5, padx=5)
-            client_combo = ttk.Combobox(
-                input_frame, textvariable=self.client_var,
-                state="readonly",
-                postcommand=lambda: self.populate_client_combo(client_combo))
-            client_combo.grid(row=0, column=1, pady=5, padx=5, sticky='ew')
-            self.populate_client_combo(client_combo)
-
-            airline_id_label = tk.Label(input_frame, text="Airline:")
-            airline_id_label.grid(row=0, column=2, sticky='e', pady=5, padx=5)
-            airline_combo = ttk.Combobox(
-                input_frame, textvariable=self.airline_var,
-                state="readonly",
-                postcommand=lambda: self.populate_airline_combo(airline_combo))
-            airline_combo.grid(row=0, column=3, pady=5, padx=5, sticky='ew')
-            self.populate_airline_combo(airline_combo)
-
-            # Date field
-            date_label = tk.Label(input_frame, text="Date:")
-            date_label.grid(row=1, column=0, sticky='e', pady=5, padx=5)
-            date_entry = DateEntry(input_frame, width=12, background='darkblue',
-                                   foreground='white', borderwidth=2,
-                                   date_pattern='yyyy-mm-dd',
-                                   textvariable=self.date_var)
-            date_entry.set_date(datetime.strptime(display_date, "%Y-%m-%d"))
-            date_entry.grid(row=1, column=1, pady=5, padx=5, sticky='ew')
-
-            # Start City field
-            start_city_label = tk.Label(input_frame, text="Start City:")
-            start_city_label.grid(row=1, column=2, sticky='e', pady=5, padx=5)
-            start_city_entry = tk.Entry(
-                input_frame, textvariable=self.start_city_var, width=30)
-            start_city_entry.grid(row=1, column=3, pady=5, padx=5, sticky='ew')
-
-            # End City field
-            end_city_label = tk.Label(input_frame, text="End City:")
-            end_city_label.grid(row=2, column=0, sticky='e', pady=5, padx=5)
-            end_city_entry = tk.Entry(
-                input_frame, textvariable=self.end_city_var, width=30)
-            end_city_entry.grid(row=2, column=1, pady=5, padx=5, sticky='ew')
-
-            # Make the input fields responsive
-            for i in range(4):
-                input_frame.grid_columnconfigure(i, weight=1)
-
-            # Create a frame for the buttons
-            button_frame = tk.Frame(update_record_modal)
-            button_frame.pack(pady=10)
-
-            # Add Update and Cancel buttons
-            update_button = tk.Button(
-                button_frame, text="Update",
-                command=lambda: self.update_flight_from_modal(
-                    flight, update_record_modal))
-            update_button.pack(side='left', padx=5)
-            update_button.bind("<Enter>", self.button_on_enter)
-            update_button.bind("<Leave>", self.button_on_leave)
-            update_button.bind("<Button-1>", self.button_on_click)
-
-            cancel_button = tk.Button(
-                button_frame, text="Cancel", command=update_record_modal.destroy)
-            cancel_button.pack(side='left', padx=5)
-            cancel_button.bind("<Enter>", self.button_on_enter)
-            cancel_button.bind("<Leave>", self.button_on_leave)
-            cancel_button.bind("<Button-1>", self.button_on_click)
-
-            # Make the modal window modal (block interaction with the main window)
-            update_record_modal.transient(self.main_frame)
-            update_record_modal.grab_set()
-            self.main_frame.wait_window(update_record_modal)
+            self._update_date_entry.set_date(flight.get_date())
+            self.start_city_var.set(flight.get_start_city())
+            self.end_city_var.set(flight.get_end_city())
+            self.show_modal(self._update_record_modal)
 
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror(
                 "Error", f"Failed to open update modal: {str(e)}")
 
+    def build_update_record_modal(self):
+        """Build the modal window used to update flight records."""
+        # Create a new Toplevel window (modal)
+        update_record_modal = tk.Toplevel(self.main_frame)
+        update_record_modal.title("Update Flight Record")
+        self.center_window(update_record_modal, 700, 200)
+
+        # Add a label to the modal
+        label = tk.Label(update_record_modal,
+                         text="Update Flight Record", font=('Arial', 14))
+        label.pack(pady=10)
+
+        # Create a frame for the input fields
+        input_frame = tk.Frame(update_record_modal)
+        input_frame.pack(pady=10, padx=10, fill='both', expand=True)
+
+        # Add combo boxes for Client ID and Airline ID
+        client_id_label = tk.Label(input_frame, text="Client:")
+        client_id_label.grid(row=0, column=0, sticky='e', pady=5, padx=5)
+        client_combo = ttk.Combobox(
+            input_frame, textvariable=self.client_var,
+            state="readonly",
+            postcommand=lambda: self.populate_client_combo(client_combo))
+        client_combo.grid(row=0, column=1, pady=5, padx=5, sticky='ew')
+
+        airline_id_label = tk.Label(input_frame, text="Airline:")
+        airline_id_label.grid(row=0, column=2, sticky='e', pady=5, padx=5)
+        airline_combo = ttk.Combobox(
+            input_frame, textvariable=self.airline_var,
+            state="readonly",
+            postcommand=lambda: self.populate_airline_combo(airline_combo))
+        airline_combo.grid(row=0, column=3, pady=5, padx=5, sticky='ew')
+
+        # Date field, set to the flight's date each time the modal is opened
+        date_label = tk.Label(input_frame, text="Date:")
+        date_label.grid(row=1, column=0, sticky='e', pady=5, padx=5)
+        self._update_date_entry = DateEntry(input_frame, width=12, background='darkblue',
+                                            foreground='white', borderwidth=2,
+                                            date_pattern='yyyy-mm-dd',
+                                            textvariable=self.date_var)
+        self._update_date_entry.grid(row=1, column=1, pady=5, padx=5, sticky='ew')
+
+        # Start City field
+        start_city_label = tk.Label(input_frame, text="Start City:")
+        start_city_label.grid(row=1, column=2, sticky='e', pady=5, padx=5)
+        start_city_entry = tk.Entry(
+            input_frame, textvariable=self.start_city_var, width=30)
+        start_city_entry.grid(row=1, column=3, pady=5, padx=5, sticky='ew')
+
+        # End City field
+        end_city_label = tk.Label(input_frame, text="End City:")
+        end_city_label.grid(row=2, column=0, sticky='e', pady=5, padx=5)
+        end_city_entry = tk.Entry(
+            input_frame, textvariable=self.end_city_var, width=30)
+        end_city_entry.grid(row=2, column=1, pady=5, padx=5, sticky='ew')
+
+        # Make the input fields responsive
+        for i in range(4):
+            input_frame.grid_columnconfigure(i, weight=1)
+
+        # Create a frame for the buttons
+        button_frame = tk.Frame(update_record_modal)
+        button_frame.pack(pady=10)
+
+        # Add Update and Cancel buttons. The flight being updated
+        # is the one stored when the modal was last opened.
+        update_button = ttk.Button(
+            button_frame, text="Update", style="Hover.TButton",
+            command=lambda: self.update_flight_from_modal(
+                self._update_flight, update_record_modal))
+        update_button.pack(side='left', padx=5)
+
+        cancel_button = ttk.Button(
+            button_frame, text="Cancel", command=lambda: self.hide_modal(update_record_modal),
+            style="Hover.TButton")
+        cancel_button.pack(side='left', padx=5)
+
+        # Closing the window hides it too, so that it can be shown again
+        update_record_modal.protocol(
+            "WM_DELETE_WINDOW", lambda: self.hide_modal(update_record_modal))
+        update_record_modal.transient(self.main_frame)
+        return update_record_modal
+
+    def show_modal(self, modal):
+        """Show a modal window, blocking interaction with the main window."""
+        modal.deiconify()
+        modal.lift()
+        modal.grab_set()
+
+    def hide_modal(self, modal):
+        """Hide a modal window, keeping it to be shown again."""
+        modal.grab_release()
+        modal.withdraw()
+
     def create_flight_from_modal(self, modal):
         """Create a new flight record from the modal form."""
         try:
@@ -487,8 +522,8 @@ class FlightGUI:
                 return
 
             # Parse client ID and airline ID
-            client_id = int(self.client_var.get().split(" - ")[0])
-            airline_id = int(self.airline_var.get().split(" - ")[0])
+            client_id = self.parse_id(self.client_var.get())
+            airline_id = self.parse_id(self.airline_var.get())
 
             # Check if date is in correct format
             date_str = self.date_var.get()
@@ -511,7 +546,7 @@ class FlightGUI:
             self.load_flights()
 
             # Close the modal
-            modal.destroy()
+            self.hide_modal(modal)
 
             messagebox.showinfo("Success", "Flight created successfully!")
         except Exception as e:  # pylint: disable=W0718
@@ -528,30 +563,34 @@ class FlightGUI:
                 return
 
             # Parse client ID and airline ID
-            new_client_id = int(self.client_var.get().split(" - ")[0])
-            new_airline_id = int(self.airline_var.get().split(" - ")[0])
-
-            # Store original values for finding the record to update
-            original_client_id = flight.get_client_id()
-            original_airline_id = flight.get_airline_id()
-            original_date = flight.get_date()
-
-            # Update flight attributes
-            flight.set_client_id(new_client_id)
-            flight.set_airline_id(new_airline_id)
-            flight.set_date(self.date_var.get())
-            flight.set_start_city(self.start_city_var.get())
-            flight.set_end_city(self.end_city_var.get())
+            new_client_id = self.parse_id(self.client_var.get())
+            new_airline_id = self.parse_id(self.airline_var.get())
+
+            # Build the updated flight separately. The selected flight is
+            # shared with the cached rows, so it is left unchanged, and
+            # still identifies the record if the form values are invalid.
+            updated_flight = Flight(
+                client_id=new_client_id,
+                airline_id=new_airline_id,
+                date=self.date_var.get(),
+                start_city=self.start_city_var.get(),
+                end_city=self.end_city_var.get()
+            )
 
             # Update flight in record manager with original values to find the correct record
-            self.record_manager.update_flight(
-                flight, original_client_id, original_airline_id, original_date)
+            success = self.record_manager.update_flight(
+                updated_flight, flight.get_client_id(), flight.get_airline_id(),
+                flight.get_date())
+            if not success:
+                messagebox.showerror(
+                    "Error", "Could not find the flight record to update")
+                return
 
             # Refresh flight list
             self.load_flights()
 
             # Close the modal
-            modal.destroy()
+            self.hide_modal(modal)
 
             messagebox.showinfo("Success", "Flight updated successfully!")
         except Exception as e:  # pylint: disable=W0718
@@ -566,22 +605,19 @@ class FlightGUI:
             return
 
         try:
-            # Get values from the selected flight record
-            client_id = self.selected_flight.get("Client_ID")
-            airline_id = self.selected_flight.get("Airline_ID")
-            date_str = self.selected_flight.get("Date")
-            start_city = self.selected_flight.get("Start City")
-            end_city = self.selected_flight.get("End City")
+            # Get values from the selected flight
+            flight = self.selected_flight
+            client_id = flight.get_client_id()
+            airline_id = flight.get_airline_id()
+            start_city = flight.get_start_city()
+            end_city = flight.get_end_city()
 
             # Get client and airline names for better confirmation message
-            client = self.record_manager.get_client(client_id)
-            airline = self.record_manager.get_airline(airline_id)
-            client_name = client.get_name() if client else "Unknown"
-            airline_name = airline.get_company_name() if airline else "Unknown"
+            client_name = self.get_client_names().get(client_id, "Unknown")
+            airline_name = self.get_airline_names().get(airline_id, "Unknown")
 
-            # Format date for display (remove time part if present)
-            display_date = date_str.split(
-                "T")[0] if "T" in date_str else date_str
+            # Format date for display, without the time
+            display_date = _display_date(flight.get_date())
 
             confirm = messagebox.askyesno(
                 "Confirm Delete",
@@ -593,7 +629,7 @@ class FlightGUI:
 
             # Use record manager to delete the flight with the exact values
             success = self.record_manager.delete_flight(
-                client_id, airline_id, date_str)
+                client_id, airline_id, flight.get_date())
 
             if success:
                 # Refresh flight list
@@ -606,8 +642,24 @@ class FlightGUI:
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror("Error", f"Failed to delete flight: {str(e)}")
 
-    def search_flights(self):
+    def schedule_search(self, event=None):  # pylint: disable=W0613
+        """
+        Search for flights shortly after the user stops typing.
+        Each key press reschedules the search, so a burst of typing
+        runs a single search for the final terms. Searches run while
+        typing do not report an empty result with a message box.
+        """
+        if self._search_after is not None:
+            self.master.after_cancel(self._search_after)
+        self._search_after = self.master.after(200, self.search_flights, False)
+
+    def search_flights(self, report_empty=True):
         """Search for flights based on the search criteria."""
+        # A search run now makes any scheduled one redundant
+        if self._search_after is not None:
+            self.master.after_cancel(self._search_after)
+            self._search_after = None
+
         start_city = self.search_start_var.get().strip()
         end_city = self.search_end_var.get().strip()
         date = self.search_date_var.get().strip()
@@ -624,14 +676,14 @@ class FlightGUI:
 
         if client_selection:
             try:
-                client_id = int(client_selection.split(" - ")[0])
-            except (ValueError, IndexError):
+                client_id = self.parse_id(client_selection)
+            except ValueError:
                 pass
 
         if airline_selection:
             try:
-                airline_id = int(airline_selection.split(" - ")[0])
-            except (ValueError, IndexError):
+                airline_id = self.parse_id(airline_selection)
+            except ValueError:
                 pass
 
         # If all search terms are empty, load all flights
@@ -650,84 +702,41 @@ class FlightGUI:
                         "Error", "Invalid date format. Use YYYY-MM-DD.")
                     return
 
-            # Get all flights from record manager
-            flights = []
-            for record in self.record_manager.records:
-                if record.get("Type") == "flight":
-                    flight = Flight.from_dict(record)
-
-                    # Filter by criteria
-                    match = True
-
-                    # Check client ID
-                    if client_id and flight.get_client_id() != client_id:
-                        match = False
-
-                    # Check airline ID
-                    if airline_id and flight.get_airline_id() != airline_id:
-                        match = False
-
-                    # Check start city
-                    if start_city and start_city.lower() not in flight.get_start_city().lower():
-                        match = False
-
-                    # Check end city
-                    if end_city and end_city.lower() not in flight.get_end_city().lower():
-                        match = False
-
-                    # Check date
-                    if search_date:
-                        flight_date = flight.get_date()
-                        if isinstance(flight_date, str):
-                            # Convert string date to datetime for comparison
-                            try:
-                                if 'T' in flight_date:
-                                    flight_date = datetime.fromisoformat(
-                                        flight_date)
-                                else:
-                                    flight_date = datetime.strptime(
-                                        flight_date, "%Y-%m-%d")
-                            except (ValueError, TypeError):
-                                match = False
-                                continue
-
-                        # Compare dates (ignoring time)
-                        if isinstance(flight_date, datetime) and flight_date.date() \
-                                != search_date.date():
-                            match = False
-
-                    if match:
-                        flights.append(flight)
-
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Add search results to treeview
-            for flight in flights:
-                # Get client and airline names
-                client = self.record_manager.get_client(flight.get_client_id())
-                airline = self.record_manager.get_airline(
-                    flight.get_airline_id())
-
-                client_name = client.get_name() if client else "Unknown"
-                airline_name = airline.get_company_name() if airline else "Unknown"
-
-                # Format date
-                date_str = flight.get_date()
-                if isinstance(date_str, datetime):
-                    date_str = date_str.strftime("%Y-%m-%d")
-
-                self.tree.insert("", "end", values=(
-                    f"{flight.get_client_id()} - {client_name}",
-                    f"{flight.get_airline_id()} - {airline_name}",
-                    date_str,
-                    flight.get_start_city(),
-                    flight.get_end_city()
-                ))
+            # Search results are reused for a repeat of the same search, until
+            # the flights, clients or airlines change. City names are matched
+            # regardless of case, so they are lowercased in the key.
+            versions = self.record_versions()
+            if self._search_cache[0] != versions:
+                self._search_cache = (versions, {})
+            cache_key = (start_city.lower(), end_city.lower(), search_date,
+                         client_id, airline_id)
+            results = self._search_cache[1].get(cache_key)
+            if results is None:
+                # Search flights through the record manager, which starts from the
+                # flights of the selected client or airline, when there is one,
+                # instead of checking every record. Dates are compared by day.
+                flights = self.record_manager.search_flights(
+                    start_city=start_city, end_city=end_city, date=search_date,
+                    client_id=client_id, airline_id=airline_id)
+
+                # Build the rows of the search results
+                client_names = self.get_client_names()
+                airline_names = self.get_airline_names()
+                rows = []
+                for flight in flights:
+                    # Get client and airline names
+                    client_name = client_names.get(flight.get_client_id(), "Unknown")
+                    airline_name = airline_names.get(flight.get_airline_id(), "Unknown")
+
+                    rows.append(self.flight_row(flight, client_name, airline_name))
+                results = self._search_cache[1][cache_key] = (rows, flights)
+            rows, flights = results
+
+            # Replace the rows of the treeview with the search results
+            self.fill_tree(rows, flights)
 
             # Show message if no results found
-            if not flights:
+            if not flights and report_empty:
                 messagebox.showinfo(
                     "Search Results", "No flights found matching the criteria.")
 
@@ -740,39 +749,109 @@ class FlightGUI:
         if self.tree is None:
             return
 
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Get all flights from record manager
-        flights = []
-        for record in self.record_manager.records:
-            if record.get("Type") == "flight":
-                client_id = record.get("Client_ID")
-                airline_id = record.get("Airline_ID")
-
-                # Get client and airline objects using record manager
-                client = self.record_manager.get_client(client_id)
-                airline = self.record_manager.get_airline(airline_id)
-
-                if client and airline:
-                    flight = Flight.from_dict(record)
-                    flights.append((flight, client, airline))
-
-        # Add flights to treeview
-        for flight, client, airline in flights:
-            # Format date
-            date_str = flight.get_date()
-            if isinstance(date_str, datetime):
-                date_str = date_str.strftime("%Y-%m-%d")
-
-            self.tree.insert("", "end", values=(
-                f"{flight.get_client_id()} - {client.get_name()}",
-                f"{flight.get_airline_id()} - {airline.get_company_name()}",
-                date_str,
-                flight.get_start_city(),
-                flight.get_end_city()
-            ))
+        # The rows are only built again after the flights, clients or
+        # airlines change, since they show the names of both
+        versions = self.record_versions()
+        if self._flight_rows[0] != versions:
+            client_names = self.get_client_names()
+            airline_names = self.get_airline_names()
+            rows = []
+            flights = []
+            for flight in self.record_manager.iter_flights():
+                # Get client and airline names with a lookup each
+                client_id = flight.get_client_id()
+                airline_id = flight.get_airline_id()
+
+                if client_id in client_names and airline_id in airline_names:
+                    rows.append(self.flight_row(
+                        flight, client_names[client_id], airline_names[airline_id]))
+                    flights.append(flight)
+            self._flight_rows = (versions, tuple(rows), tuple(flights))
+
+        # Replace the rows of the treeview with all the flights
+        self.fill_tree(*self._flight_rows[1:])
+
+    def record_versions(self):
+        """Get the versions of the flight, client and airline records shown by the rows."""
+        return (self.record_manager.flights_version,
+                self.record_manager.clients_version,
+                self.record_manager.airlines_version)
+
+    @staticmethod
+    def flight_row(flight, client_name, airline_name):
+        """Format the values shown in the treeview row of a flight."""
+        # Flight dates are always datetime objects, set through set_date
+        return (
+            f"{flight.get_client_id()} - {client_name}",
+            f"{flight.get_airline_id()} - {airline_name}",
+            _display_date(flight.get_date()),
+            flight.get_start_city(),
+            flight.get_end_city()
+        )
+
+    def fill_tree(self, rows, flights):
+        """
+        Make the treeview show the given rows, in order, showing
+        the given flights in the same order.
+
+        Each row is identified by the client ID, airline ID and date of
+        its flight, which are used as the treeview item ID. Only the
+        differences with the rows already shown are applied: rows no
+        longer present are deleted with a single call, new rows are
+        inserted and changed rows are updated in place, while unchanged
+        rows are left untouched. If the order of the remaining rows
+        differs, they are all inserted again. An empty treeview is
+        filled with a single call, through the Tcl procedure shared
+        by the record GUIs. The flight of each item is kept by its ID,
+        for selection.
+        """
+        tree = self.tree
+        shown_rows = self._shown_rows
+        new_rows = {}
+        flights_by_item = {}
+        for row, flight in zip(rows, flights):
+            iid = self.flight_item_id(flight)
+            if iid in new_rows:  # Repeated flights are told apart by position.
+                iid = f"{iid}/{len(new_rows)}"
+            new_rows[iid] = row
+            flights_by_item[iid] = flight
+        self._flights_by_item = flights_by_item
+
+        # Delete the rows that are no longer present
+        removed = [iid for iid in shown_rows if iid not in new_rows]
+        if removed:
+            tree.delete(*removed)
+            for iid in removed:
+                del shown_rows[iid]
+
+        # Clear the treeview if the remaining rows are not in the new order
+        kept = tuple(iid for iid in new_rows if iid in shown_rows)
+        if tree.get_children() != kept:
+            if kept:
+                tree.delete(*kept)
+            shown_rows.clear()
+
+        # Fill an empty treeview with all the rows at once
+        if not shown_rows:
+            if new_rows:
+                append_rows(tree, new_rows, new_rows.values())
+                shown_rows.update(new_rows)
+            return
+
+        # Insert the new rows and update the changed ones
+        insert = tree.insert
+        for index, (iid, row) in enumerate(new_rows.items()):
+            shown_row = shown_rows.get(iid)
+            if shown_row is None:
+                insert("", index, iid=iid, values=row)
+            elif shown_row != row:
+                tree.item(iid, values=row)
+            shown_rows[iid] = row
+
+    @staticmethod
+    def flight_item_id(flight):
+        """Get the treeview item ID of a flight, from its client ID, airline ID and date."""
+        return f"{flight.get_client_id()}/{flight.get_airline_id()}/{flight.get_date().isoformat()}"
 
     def on_flight_select(self, event):  # pylint: disable=W0613
         """Handle flight selection in the treeview."""
@@ -786,55 +865,86 @@ class FlightGUI:
         if not selected_items:
             return
 
-        # Get the first selected item
-        selected_item = selected_items[0]
-        values = self.tree.item(selected_item, "values")
+        # Get the flight of the first selected item, kept when the rows
+        # were inserted, so that its date tells apart the flights of the
+        # same client with the same airline
+        self.selected_flight = self._flights_by_item.get(selected_items[0])
 
-        try:
-            # Parse client ID and airline ID from values
-            client_id = int(values[0].split(" - ")[0])
-            airline_id = int(values[1].split(" - ")[0])
-
-            # Find the original flight record
-            for record in self.record_manager.records:
-                if (record.get("Type") == "flight" and
-                    record.get("Client_ID") == client_id and
-                        record.get("Airline_ID") == airline_id):
-                    # Store the entire record
-                    self.selected_flight = record
-                    break
-        except Exception as e:  # pylint: disable=W0718
-            messagebox.showerror("Error", f"Failed to select flight: {str(e)}")
+    @staticmethod
+    def parse_id(choice):
+        """
+        Parse the ID at the start of a client or airline choice,
+        formatted as "ID - Name". Only the text before the first
+        separator is split off, without splitting the name.
+        """
+        return int(choice.partition(" - ")[0])
+
+    def get_client_names(self):
+        """
+        Get the name of every client by ID. The names are only read
+        again from the record manager after the clients change.
+        """
+        version = self.record_manager.clients_version
+        if self._client_names[0] != version:
+            self._client_names = (version, self.record_manager.get_client_names())
+        return self._client_names[1]
+
+    def get_airline_names(self):
+        """
+        Get the company name of every airline by ID. The names are only
+        read again from the record manager after the airlines change.
+        """
+        version = self.record_manager.airlines_version
+        if self._airline_names[0] != version:
+            self._airline_names = (version, self.record_manager.get_airline_names())
+        return self._airline_names[1]
 
     def populate_client_combo(self, combo):
-        """Populate the client combo box with client names."""
-        # Get all clients from record manager
-        clients = []
-        for record in self.record_manager.records:
-            if record.get("Type") == "client":
-                client = Client.from_dict(record)
-                clients.append((client.get_id(), client.get_name()))
+        """
+        Populate the client combo box with client names.
 
-        # Sort clients by name
-        clients.sort(key=lambda x: x[1])
+        The choices are only built again after the clients change, and
+        only set on a combo box that does not already show them.
+        """
+        version = self.record_manager.clients_version
+        if self._client_choices[0] != version:
+            # Get all clients from their names by ID
+            clients = list(self.get_client_names().items())
+
+            # Sort clients by name
+            clients.sort(key=itemgetter(1))
+
+            self._client_choices = (version, tuple(f"{id} - {name}" for id, name in clients))
 
         # Update combobox values
-        combo['values'] = [f"{id} - {name}" for id, name in clients]
+        self.set_combo_choices(combo, *self._client_choices)
 
     def populate_airline_combo(self, combo):
-        """Populate the airline combo box with airline names."""
-        # Get all airlines from record manager
-        airlines = []
-        for record in self.record_manager.records:
-            if record.get("Type") == "airline":
-                airline = Airline.from_dict(record)
-                airlines.append((airline.get_id(), airline.get_company_name()))
+        """
+        Populate the airline combo box with airline names.
+
+        The choices are only built again after the airlines change, and
+        only set on a combo box that does not already show them.
+        """
+        version = self.record_manager.airlines_version
+        if self._airline_choices[0] != version:
+            # Get all airlines from their names by ID
+            airlines = list(self.get_airline_names().items())
+
+            # Sort airlines by name
+            airlines.sort(key=itemgetter(1))
 
-        # Sort airlines by name
-        airlines.sort(key=lambda x: x[1])
+            self._airline_choices = (version, tuple(f"{id} - {name}" for id, name in airlines))
 
         # Update combobox values
-        combo['values'] = [f"{id} - {name}" for id, name in airlines]
+        self.set_combo_choices(combo, *self._airline_choices)
+
+    def set_combo_choices(self, combo, version, choices):
+        """Set the choices of a combo box, unless it already shows this version."""
+        name = str(combo)
+        if self._combo_versions.get(name) != version:
+            combo['values'] = choices
+            self._combo_versions[name] = version
 
     def add_placeholder(self, entry, placeholder):
         """Add a placeholder to the given entry widget."""
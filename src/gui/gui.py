@@ -32,9 +32,16 @@ class TravelAgentApp(tk.Tk):
         if not hasattr(self, 'record_manager'):
             self.record_manager = RecordManager()
 
-        # Hides notebook tabs since we are using a custom nav bar
-        style = ttk.Style()
-        style.layout('TNotebook.Tab', [])  # This removes the tabs
+        # Report the records of the file that could not be read
+        skipped = len(self.record_manager.skipped_records)
+        if skipped:
+            messagebox.showwarning(
+                "Warning", f"{skipped} record(s) in the record file are invalid or repeat "
+                           "an ID. They were not loaded, but are kept in the file.")
+
+        # Configure the ttk styles of all the tabs, hiding the notebook
+        # tabs since we are using a custom nav bar
+        self.configure_styles()
 
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self)
@@ -58,14 +65,42 @@ class TravelAgentApp(tk.Tk):
         # Bind tab change event AFTER notebook is created
         self.notebook.bind("<<NotebookTabChanged>>", self.update_nav_bar)
 
-        # Initialize GUI components
-        self.client_gui = ClientGUI(self.client_frame, self.record_manager)
-        self.airline_gui = AirlineGUI(self.airline_frame, self.record_manager)
-        self.flight_gui = FlightGUI(self.flight_frame, self.record_manager)
+        # Initialize GUI components when their tab is first shown, so that
+        # startup only builds and fills the tab that is selected
+        self.client_gui = None
+        self.airline_gui = None
+        self.flight_gui = None
+        self.create_tab_gui(self.notebook.index("current"))
 
         # Bind close event to save records
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    def configure_styles(self):
+        """
+        Configure the ttk styles shared by the whole application, once
+        for the Tcl interpreter of this window.
+
+        ttk styles belong to an interpreter, so a new Tk root needs them
+        configured again. Reconfiguring a style makes Tk restyle every
+        widget using it, so the styles are left unchanged when the hover
+        button map shows that they are already configured. The record tabs
+        use these styles without configuring them again.
+        """
+        style = ttk.Style(self)
+        if style.map("Hover.TButton", "background"):
+            return
+        style.layout('TNotebook.Tab', [])  # This removes the tabs
+
+        # Set the background colour of the Treeview
+        style.configure("Treeview", background="#D9D9D9",
+                        fieldbackground="#D9D9D9")
+
+        # Buttons change colour on hover and click through their ttk style,
+        # which Tk applies itself, without a Python callback per event.
+        style.configure("Hover.TButton", background='#F0F0F0')
+        style.map("Hover.TButton",
+                  background=[('pressed', '#BFBFBF'), ('active', '#BFBFBF')])
+
     # Moved the nav bar to a global nav bar instead of
     # one for each page. This is easier to manage.
     # Had to hide the default notebook nav bars as a result.
@@ -105,18 +140,25 @@ class TravelAgentApp(tk.Tk):
 
             self.nav_labels.append(label)
 
-        # Bind tab change event to update navigation bar
-        self.notebook.bind("<<NotebookTabChanged>>", self.update_nav_bar)
-
     def update_nav_bar(self, event=None):  # pylint: disable=W0613
         """Update navigation bar to highlight the selected tab"""
         selected_tab = self.notebook.index("current")
+        self.create_tab_gui(selected_tab)
         for i, label in enumerate(self.nav_labels):
             if i == selected_tab:
                 label.config(bg='#A3A3A3')  # Darker color for selected tab
             else:
                 label.config(bg='#FFFFFF')  # Default color for unselected tabs
 
+    def create_tab_gui(self, index):
+        """Create the GUI component of the tab at the given index, unless it already exists."""
+        if index == 0 and self.client_gui is None:
+            self.client_gui = ClientGUI(self.client_frame, self.record_manager)
+        elif index == 1 and self.airline_gui is None:
+            self.airline_gui = AirlineGUI(self.airline_frame, self.record_manager)
+        elif index == 2 and self.flight_gui is None:
+            self.flight_gui = FlightGUI(self.flight_frame, self.record_manager)
+
     def on_enter(self, event):
         """Change background color on hover only if not selected"""
         selected_tab = self.notebook.index("current")
@@ -139,7 +181,7 @@ class TravelAgentApp(tk.Tk):
     def on_close(self):
         """Save records when closing the application"""
         try:
-            self.record_manager.save_records()
+            self.record_manager.flush()
             self.destroy()
         except Exception as e:  # pylint: disable=W0718
             messagebox.showerror("Error", f"Failed to save records: {str(e)}")
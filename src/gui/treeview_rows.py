@@ -0,0 +1,34 @@
+"""
+Module for the treeview helpers shared by the record GUIs of the Travel Agent
+Record Management System. It inserts many rows into a treeview at once.
+"""
+
+# Tcl procedure inserting a list of rows at the end of a treeview, with the
+# given item IDs. Calling it once crosses from Python into Tcl a single time,
+# instead of once per row, and the rows are passed as Tcl lists, so their
+# values need no quoting.
+_APPEND_ROWS_PROC = "::travelbuddy::append_rows"
+_APPEND_ROWS_SCRIPT = """
+namespace eval ::travelbuddy {
+    proc append_rows {tree items rows} {
+        foreach item $items row $rows {
+            $tree insert {} end -id $item -values $row
+        }
+    }
+}
+"""
+
+# Tcl interpreters in which the procedure is already defined.
+_defined_in = set()
+
+
+def append_rows(tree, items, rows):
+    """
+    Insert the given rows at the end of a treeview, with the given item IDs,
+    through a single call to the Tcl procedure. The procedure is defined the
+    first time it is used in the treeview's Tcl interpreter.
+    """
+    if tree.tk not in _defined_in:
+        tree.tk.eval(_APPEND_ROWS_SCRIPT)
+        _defined_in.add(tree.tk)
+    tree.tk.call(_APPEND_ROWS_PROC, str(tree), tuple(items), tuple(rows))
@@ -14,7 +14,12 @@ def main():
     Main function that launches the RMS and keeps it active.
     """
     app = TravelAgentApp()  # The GUI is created.
-    app.mainloop()  # The GUI is kept running until the user close it.
+    try:
+        app.mainloop()  # The GUI is kept running until the user close it.
+    finally:
+        # Updates and deletions are only saved by a flush, so they are saved
+        # however the GUI stops, such as through Ctrl+C or an error.
+        app.record_manager.flush()
 
 
 # Conditional lanching the main function.
@@ -31,29 +31,41 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     - Flight record operations (create, read, update, delete, search)
     - Record dependency handling
 
-    Each test uses a temporary file for isolation.
+    Each test uses its own file, in a temporary directory, for isolation.
     """
 
-    def setUp(self):
+    # Arguments of the client and airline shared by many tests. Each test
+    # builds its own objects from them, so no test affects another.
+    JOHN = (1, "client", "John", "123 St", "", "", "London", "LONDON", "10001", "UK")
+    AIRCO = (9, "airline", "AirCo")
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the test environment once, before all tests.
+        Creates a temporary directory holding the files of every test,
+        in memory on systems providing /dev/shm.
         """
-        Set up the test environment before each test. 
-        Creates a temporary JSONL file and initializes a RecordManager
-        instance with this file path.
+        cls.temp_dir = tempfile.TemporaryDirectory(
+            dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up the test environment once, after all tests.
+        Removes the temporary directory and the files it holds.
         """
-        # Create a temporary file to store the test records
-        self.temp_file = tempfile.NamedTemporaryFile(
-            delete=False, suffix='.jsonl')
-        file_path = self.temp_file.name
-        self.rm = RecordManager(file_path)
+        cls.temp_dir.cleanup()
 
-    def tearDown(self):
+    def setUp(self):
         """
-        Clean up the test environment after each test. 
-        Closes and removes the temporary file created in setUp.
+        Set up the test environment before each test.
+        Initializes a RecordManager instance with a JSONL file named after
+        the test. The file is only created when the first record is written.
         """
-        # Close and delete the temporary file
-        self.temp_file.close()
-        os.unlink(self.temp_file.name)
+        self.file_path = os.path.join(
+            self.temp_dir.name, f"{self._testMethodName}.jsonl")
+        self.rm = RecordManager(self.file_path)
 
     # Client Tests
 
@@ -81,6 +93,24 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.rm.create_client(client)
 
+    def test_get_next_id(self):
+        """Test that generated IDs are unique and carry the type identifier."""
+        # Generate IDs and create a client using the next ID in line
+        first_id = self.rm.get_next_id("client")
+        self.rm.create_client(Client(first_id + 1, "client", "John"))
+        second_id = self.rm.get_next_id("client")
+        airline_id = self.rm.get_next_id("airline")
+
+        # Test the generated IDs
+        self.assertGreater(second_id, first_id + 1,
+                           "IDs already in use should be skipped")
+        self.assertTrue(str(second_id).startswith("1"),
+                        "Client IDs should start with a 1")
+        self.assertTrue(str(airline_id).startswith("9"),
+                        "Airline IDs should start with a 9")
+        self.assertEqual(len(str(airline_id)), 12,
+                         "Generated IDs should be 12 digits long")
+
     def test_get_client(self):
         """Test client retrieval and handling of non-existent clients."""
         # Create a test client
@@ -99,11 +129,135 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         self.assertIsNone(
             non_existent, "Non-existent client should return None")
 
+    def test_load_incomplete_records(self):
+        """Test that incomplete records in the file are kept, but not read as valid."""
+        # Write a valid flight and records missing required fields
+        lines = ['{"ID": 1, "Type": "client", "Name": "John"}',
+                 '{"ID": 9, "Type": "airline", "Company Name": "AirCo"}',
+                 '{"ID": 11, "Type": "client"}',
+                 '{"Type": "airline", "Company Name": "NoID"}',
+                 '{"Client_ID": 1, "Airline_ID": 9, "Type": "flight", "Date": "2025-01-01",'
+                 ' "Start City": "London", "End City": "LP"}',
+                 '{"Client_ID": 1, "Airline_ID": 9, "Type": "flight", "Date": "2025-01-02",'
+                 ' "Start City": "London"}',
+                 '{"Client_ID": "1", "Airline_ID": 9, "Type": "flight", "Date": "2025-01-03",'
+                 ' "Start City": "London", "End City": "LP"}',
+                 '{"ID": 1, "Type": "client", "Name": "Duplicate"}']
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        rm = RecordManager(self.file_path)
+
+        # Verify only the valid records are read
+        self.assertIsNone(rm.get_client(11), "A client without a name should not be read")
+        self.assertEqual(len(rm.get_all_airlines()), 1, "An airline without ID should not be read")
+        self.assertEqual(len(list(rm.iter_flights())), 1,
+                         "A flight without end city should not be read")
+        results = rm.search_flights(end_city="LP")
+        self.assertEqual(len(results), 1, "Should find the valid flight")
+        self.assertEqual(rm.get_client(1).get_name(), "John",
+                         "A repeated client ID should not replace the first client")
+        self.assertEqual(len(rm.skipped_records), 5, "Records not read should be reported")
+
+        # Verify the invalid records are saved back
+        rm.save_records()
+        self.assertEqual(len(RecordManager(self.file_path).records), len(lines),
+                         "Invalid records should be kept in the file")
+
+    def test_get_records_after_reload(self):
+        """Test client and airline retrieval from a freshly loaded file."""
+        # Create test records and save them to the file
+        self.rm.create_client(Client(1, "client", "Jane"))
+        self.rm.create_airline(Airline(*self.AIRCO))
+
+        # Load the same file into a new record manager
+        reloaded = RecordManager(self.file_path)
+
+        # Test retrieval of the loaded records
+        self.assertEqual(reloaded.get_client(1).get_name(), "Jane",
+                         "Loaded client should be retrievable by ID")
+        self.assertEqual(reloaded.get_airline(9).get_company_name(), "AirCo",
+                         "Loaded airline should be retrievable by ID")
+        self.assertIsNone(reloaded.get_client(9),
+                          "Airline ID should not match a client")
+
+    def test_iter_clients(self):
+        """Test iteration over every client, without other record types."""
+        # Create test clients and an airline
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.create_airline(Airline(*self.AIRCO))
+        self.rm.create_client(Client(11, "client", "Jane"))
+
+        # Verify only the clients are returned, in creation order
+        self.assertEqual([client.get_name() for client in self.rm.iter_clients()],
+                         ["John", "Jane"], "Should iterate over both clients in order")
+
+    def test_iter_flights(self):
+        """Test iteration over every flight, without other record types."""
+        # Create a test client and airline, and two flights
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.create_airline(Airline(*self.AIRCO))
+        self.rm.create_flight(Flight(1, 9, "2025-01-01", "London", "LP"))
+        self.rm.create_flight(Flight(1, 9, "2025-01-02", "London", "Oxford"))
+
+        # Verify only the flights are returned, in creation order
+        self.assertEqual([flight.get_end_city() for flight in self.rm.iter_flights()],
+                         ["LP", "Oxford"], "Should iterate over both flights in order")
+
+    def test_record_names(self):
+        """Test retrieval of the client and airline names by ID."""
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.create_airline(Airline(*self.AIRCO))
+
+        # Verify each name is mapped to its record's ID
+        self.assertEqual(self.rm.get_client_names(), {1: "John"},
+                         "Should map the client ID to its name")
+        self.assertEqual(self.rm.get_airline_names(), {9: "AirCo"},
+                         "Should map the airline ID to its company name")
+
+    def test_record_versions(self):
+        """Test that client and airline changes advance their own version only."""
+        clients_version = self.rm.clients_version
+        airlines_version = self.rm.airlines_version
+
+        # Create, update and delete a client
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.update_client(Client(1, "client", "John Doe"))
+        self.rm.delete_client(1)
+        self.assertEqual(self.rm.clients_version, clients_version + 3,
+                         "Each client change should advance the clients version")
+        self.assertEqual(self.rm.airlines_version, airlines_version,
+                         "Client changes should not advance the airlines version")
+
+        # Create, update and delete an airline
+        self.rm.create_airline(Airline(*self.AIRCO))
+        self.rm.update_airline(Airline(9, "airline", "AirCo Ltd"))
+        self.rm.delete_airline(9)
+        self.assertEqual(self.rm.airlines_version, airlines_version + 3,
+                         "Each airline change should advance the airlines version")
+
+    def test_flights_version(self):
+        """Test that every flight change advances the flights version."""
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.create_airline(Airline(*self.AIRCO))
+        flights_version = self.rm.flights_version
+
+        # Create, update and delete a flight
+        date = datetime(2025, 1, 1)
+        self.rm.create_flight(Flight(1, 9, date, "London", "Paris"))
+        self.rm.update_flight(Flight(1, 9, date, "London", "Rome"), 1, 9, date)
+        self.rm.delete_flight(1, 9)
+        self.assertEqual(self.rm.flights_version, flights_version + 3,
+                         "Each flight change should advance the flights version")
+
+        # A failed deletion leaves the version unchanged
+        self.rm.delete_flight(1, 9)
+        self.assertEqual(self.rm.flights_version, flights_version + 3,
+                         "A failed deletion should not advance the flights version")
+
     def test_update_client(self):
         """Test client update functionality and handling of non-existent clients."""
         # Create a test client
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
+        client = Client(*self.JOHN)
         self.rm.create_client(client)
 
         # Update the client data
@@ -126,11 +280,52 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         self.assertFalse(non_existent_update,
                          "Update should return False for non-existent client")
 
+    def test_update_client_after_flush(self):
+        """Test that client updates reach the file once flushed."""
+        # Create a test client and update it
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.update_client(Client(1, "client", "John Doe"))
+
+        # Flush the pending update and load the file again
+        self.rm.flush()
+        reloaded = RecordManager(self.file_path)
+
+        # Verify the loaded client holds the updated data
+        self.assertEqual(reloaded.get_client(1).get_name(), "John Doe",
+                         "Flushed update should be saved to the file")
+        self.assertEqual(len(reloaded.records), 1,
+                         "File should hold a single client record")
+
+    def test_records_read_only(self):
+        """Test that the records view cannot be changed."""
+        self.rm.create_client(Client(1, "client", "John"))
+
+        # Verify that adding or replacing records through the view fails
+        with self.assertRaises(AttributeError):
+            self.rm.records.append({"Type": "client"})
+        with self.assertRaises(TypeError):
+            self.rm.records[0] = {"Type": "client"}  # pylint: disable=E1137
+
+    def test_batch_create_clients(self):
+        """Test that clients created in a batch are saved when it ends."""
+        # Create test clients within a batch
+        with self.rm.batch():
+            self.rm.create_client(Client(1, "client", "John"))
+            self.rm.create_client(Client(11, "client", "Jane"))
+
+            # Verify nothing was written to the file yet
+            self.assertFalse(os.path.exists(self.file_path),
+                             "Batched records should not be written before the end")
+
+        # Load the file again and verify both clients were saved
+        reloaded = RecordManager(self.file_path)
+        self.assertEqual(len(reloaded.search_clients("")), 2,
+                         "Both batched clients should be saved")
+
     def test_delete_client(self):
         """Test client deletion and handling of non-existent clients."""
         # Create a test client
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
+        client = Client(*self.JOHN)
         self.rm.create_client(client)
 
         # Test successful deletion
@@ -151,20 +346,20 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_delete_client_with_flights(self):
         """Test client deletion when associated with flights and proper deletion sequence."""
         # Create test client, airline, and flight
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
-        airline = Airline(9, "airline", "AirCo")
-        self.rm.create_client(client)
-        self.rm.create_airline(airline)
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
         flight = Flight(1, 9, "2025-01-01", "London", "LP")
-        self.rm.create_flight(flight)
+        with self.rm.batch():  # Writes the three records at once.
+            self.rm.create_client(client)
+            self.rm.create_airline(airline)
+            self.rm.create_flight(flight)
 
         # Verify client with flights cannot be deleted directly
         with self.assertRaises(ValueError):
             self.rm.delete_client(1)
 
         # Delete the flight first
-        self.rm.delete_flight(1, 9, flight.get_date().isoformat())
+        self.rm.delete_flight(1, 9, flight.get_date())
 
         # Now client deletion should succeed
         success = self.rm.delete_client(1)
@@ -174,12 +369,12 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_search_clients(self):
         """Test client search functionality with various search criteria."""
         # Create test clients
-        client1 = Client(1, "client", "John", "123 St", "",
-                         "", "London", "LONDON", "10001", "UK")
+        client1 = Client(*self.JOHN)
         client2 = Client(11, "client", "Jane", "456 St", "",
                          "", "Liverpool", "LP", "90001", "UK")
-        self.rm.create_client(client1)
-        self.rm.create_client(client2)
+        with self.rm.batch():  # Writes both clients at once.
+            self.rm.create_client(client1)
+            self.rm.create_client(client2)
 
         # Test search by client name
         results = self.rm.search_clients("John")
@@ -202,6 +397,20 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         self.assertEqual(
             len(results), 0, "Should find no clients with non-existent criteria")
 
+    def test_search_client_ids(self):
+        """Test that client ID search matches the full client search."""
+        # Create test clients
+        self.rm.create_client(Client(1, "client", "John", city="London"))
+        self.rm.create_client(Client(11, "client", "Jane", city="Liverpool"))
+
+        # Verify only the IDs of matching clients are returned, in order
+        self.assertEqual(self.rm.search_client_ids("l"), [1, 11],
+                         "Should find the IDs of both clients")
+        self.assertEqual(self.rm.search_client_ids("JANE"), [11],
+                         "Search should be case-insensitive")
+        self.assertEqual(self.rm.search_client_ids("Nonexistent"), [],
+                         "Should find no IDs with non-existent criteria")
+
     # Airline Tests
 
     def test_create_airline(self):
@@ -230,7 +439,7 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_get_airline(self):
         """Test airline retrieval and handling of non-existent airlines."""
         # Create a test airline
-        airline = Airline(9, "airline", "AirCo")
+        airline = Airline(*self.AIRCO)
         self.rm.create_airline(airline)
 
         # Test retrieval of existing airline
@@ -244,10 +453,24 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         self.assertIsNone(
             non_existent, "Non-existent airline should return None")
 
+    def test_get_all_airlines(self):
+        """Test retrieval of every airline, without other record types."""
+        # Create test airlines and a client
+        self.rm.create_airline(Airline(*self.AIRCO))
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.create_airline(Airline(99, "airline", "SkyCo"))
+
+        # Verify only the airlines are returned, in creation order
+        airlines = self.rm.get_all_airlines()
+        self.assertEqual([airline.get_company_name() for airline in airlines],
+                         ["AirCo", "SkyCo"], "Should return both airlines in order")
+        self.assertEqual([airline.get_id() for airline in self.rm.iter_airlines()],
+                         [9, 99], "Should iterate over both airlines in order")
+
     def test_update_airline(self):
         """Test airline update functionality and handling of non-existent airlines."""
         # Create a test airline
-        airline = Airline(9, "airline", "AirCo")
+        airline = Airline(*self.AIRCO)
         self.rm.create_airline(airline)
 
         # Update the airline
@@ -270,7 +493,7 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_delete_airline(self):
         """Test airline deletion and handling of non-existent airlines."""
         # Create a test airline
-        airline = Airline(9, "airline", "AirCo")
+        airline = Airline(*self.AIRCO)
         self.rm.create_airline(airline)
 
         # Test successful deletion
@@ -291,20 +514,20 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_delete_airline_with_flights(self):
         """Test airline deletion when associated with flights and proper deletion sequence."""
         # Create test client, airline, and flight
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
-        airline = Airline(9, "airline", "AirCo")
-        self.rm.create_client(client)
-        self.rm.create_airline(airline)
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
         flight = Flight(1, 9, "2025-01-01", "London", "LP")
-        self.rm.create_flight(flight)
+        with self.rm.batch():  # Writes the three records at once.
+            self.rm.create_client(client)
+            self.rm.create_airline(airline)
+            self.rm.create_flight(flight)
 
         # Verify airline with flights cannot be deleted directly
         with self.assertRaises(ValueError):
             self.rm.delete_airline(9)
 
         # Delete the flight first
-        self.rm.delete_flight(1, 9, flight.get_date().isoformat())
+        self.rm.delete_flight(1, 9, flight.get_date())
 
         # Now airline deletion should succeed
         success = self.rm.delete_airline(9)
@@ -314,7 +537,7 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_search_airlines(self):
         """Test airline search functionality with various search criteria."""
         # Create test airlines
-        airline1 = Airline(9, "airline", "AirCo")
+        airline1 = Airline(*self.AIRCO)
         airline2 = Airline(91, "airline", "CX")
         self.rm.create_airline(airline1)
         self.rm.create_airline(airline2)
@@ -343,9 +566,8 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_create_flight(self):
         """Test flight creation and retrieval functionality."""
         # Create test client and airline
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
-        airline = Airline(9, "airline", "AirCo")
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
         self.rm.create_client(client)
         self.rm.create_airline(airline)
 
@@ -364,12 +586,51 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         self.assertEqual(retrieved.get_start_city(),
                          "London", "Start city should match")
 
+    def test_create_flight_with_missing_records(self):
+        """Test that flights require an existing client and airline."""
+        # Create only a test client
+        self.rm.create_client(Client(1, "client", "John"))
+
+        # Test creation with a non-existent airline
+        with self.assertRaises(ValueError):
+            self.rm.create_flight(Flight(1, 9, "2025-01-01", "London", "LP"))
+
+        # Test creation with a non-existent client
+        self.rm.create_airline(Airline(*self.AIRCO))
+        with self.assertRaises(ValueError):
+            self.rm.create_flight(Flight(11, 9, "2025-01-01", "London", "LP"))
+
+        # Verify no flight record was added
+        self.assertEqual(self.rm.get_flights_by_airline(9), [],
+                         "Rejected flights should not be stored")
+
+    def test_create_flights(self):
+        """Test bulk flight creation, which is all-or-nothing."""
+        # Create test client and airline
+        self.rm.create_client(Client(1, "client", "John"))
+        self.rm.create_airline(Airline(*self.AIRCO))
+        flights = [Flight(1, 9, "2025-01-01", "London", "LP"),
+                   Flight(1, 9, "2025-01-02", "LP", "London")]
+
+        # Verify nothing is created if one flight is invalid
+        with self.assertRaises(ValueError):
+            self.rm.create_flights(flights + [Flight(1, 99, "2025-01-03", "LP", "Paris")])
+        self.assertEqual(self.rm.get_flights_by_client(1), [],
+                         "No flight should be created when one is invalid")
+
+        # Create the valid flights and verify they are saved to the file
+        keys = self.rm.create_flights(flights)
+        self.assertEqual(keys, [(1, 9, datetime(2025, 1, 1)), (1, 9, datetime(2025, 1, 2))],
+                         "Should return the key of each created flight")
+        reloaded = RecordManager(self.file_path)
+        self.assertEqual(len(reloaded.get_flights_by_client(1)), 2,
+                         "Both flights should be saved to the file")
+
     def test_get_flight(self):
         """Test flight retrieval functionality."""
         # Create test client, airline, and flight
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
-        airline = Airline(9, "airline", "AirCo")
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
         self.rm.create_client(client)
         self.rm.create_airline(airline)
         flight = Flight(1, 9, "2025-01-01", "London", "LP")
@@ -396,9 +657,8 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_update_flight(self):
         """Test flight update functionality and handling of non-existent flights."""
         # Create test client, airline, and flight
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
-        airline = Airline(9, "airline", "AirCo")
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
         self.rm.create_client(client)
         self.rm.create_airline(airline)
         flight = Flight(1, 9, "2025-01-01", "London", "LP")
@@ -406,12 +666,11 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
 
         # Get the stored flight to extract the exact date format
         # Since we have special date handling for Flights records.
-        stored_flights = [r for r in self.rm.records if r.get("Type") == "flight"
-                          and r.get("Client_ID") == 1 and r.get("Airline_ID") == 9]
-        if not stored_flights:
+        stored_flight = self.rm.get_flight(1, 9)
+        if stored_flight is None:
             self.fail("Flight was not created successfully")
 
-        stored_date = stored_flights[0].get("Date")
+        stored_date = stored_flight.to_dict()["Date"]
 
         # Test successful flight update
         updated_flight = Flight(1, 9, stored_date, "London", "Liverpool")
@@ -440,8 +699,7 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_delete_flight(self):
         """Test flight deletion functionality and handling of non-existent flights."""
         # Create test client and airline
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
+        client = Client(*self.JOHN)
         airline = Airline(9, "airline", "AirCX")
         self.rm.create_client(client)
         self.rm.create_airline(airline)
@@ -469,17 +727,16 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
     def test_search_flights(self):
         """Test flight search functionality with various search criteria."""
         # Create test client and airline
-        client = Client(1, "client", "John", "123 St", "",
-                        "", "London", "LONDON", "10001", "UK")
-        airline = Airline(9, "airline", "AirCo")
-        self.rm.create_client(client)
-        self.rm.create_airline(airline)
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
 
         # Create test flights
         flight1 = Flight(1, 9, "2025-01-01", "London", "LP")
         flight2 = Flight(1, 9, "2025-01-01", "London", "Oxford")
-        self.rm.create_flight(flight1)
-        self.rm.create_flight(flight2)
+        with self.rm.batch():  # Writes the four records at once.
+            self.rm.create_client(client)
+            self.rm.create_airline(airline)
+            self.rm.create_flights([flight1, flight2])
 
         # Test search by start city
         results = self.rm.search_flights(start_city="London")
@@ -508,6 +765,28 @@ class TestRecordManagerCRUDAndSearch(unittest.TestCase):
         self.assertEqual(
             len(results), 0, "Should find no flights departing from Cambridge")
 
+    def test_search_flights_after_update(self):
+        """Test that flight searches match cities set by an update, ignoring case."""
+        # Create test client, airline, and flight
+        client = Client(*self.JOHN)
+        airline = Airline(*self.AIRCO)
+        self.rm.create_client(client)
+        self.rm.create_airline(airline)
+        self.rm.create_flight(Flight(1, 9, "2025-01-01", "London", "LP"))
+        stored_date = self.rm.get_flight(1, 9).to_dict()["Date"]
+
+        # Move the flight to new cities
+        self.rm.update_flight(Flight(1, 9, stored_date, "Cambridge", "Oxford"),
+                              client_id=1, airline_id=9, date=stored_date)
+
+        # Search by the new cities, in a different case
+        results = self.rm.search_flights(start_city="cambridge", end_city="OXF")
+        self.assertEqual(
+            len(results), 1, "Should find the flight by its updated cities")
+        results = self.rm.search_flights(start_city="London")
+        self.assertEqual(
+            len(results), 0, "Should not find the flight by its previous city")
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)